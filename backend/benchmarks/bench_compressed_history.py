@@ -0,0 +1,105 @@
+"""Benchmark the compressed history tier against the in-memory repository.
+
+Reports bytes per stored point and get_history decode throughput. Run from
+the repository root:
+
+    python -m backend.benchmarks.bench_compressed_history --points 100000
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from backend.src.core.config import Settings
+from backend.src.domain.entities.price import Price
+from backend.src.repositories.compressed_history import CompressedPriceRepository
+from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
+
+
+def generate_prices(ticker_id: str, count: int, seed: int = 1) -> list:
+    """Random walk ticking roughly once a second with scheduling jitter."""
+    rng = random.Random(seed)
+    timestamp = datetime(2024, 1, 15)
+    value = 100.0
+    prices = []
+    for _ in range(count):
+        timestamp += timedelta(seconds=1, microseconds=rng.randint(0, 3_000))
+        value = max(0.01, value + rng.uniform(-1.0, 1.0))
+        prices.append(Price(ticker_id=ticker_id, value=value, timestamp=timestamp))
+    return prices
+
+
+def price_object_bytes(price: Price) -> int:
+    """Approximate heap size of one stored Price: object, attribute dict, float and datetime."""
+    return (
+        sys.getsizeof(price)
+        + sys.getsizeof(price.__dict__)
+        + sys.getsizeof(price.value)
+        + sys.getsizeof(price.timestamp)
+    )
+
+
+async def run(points: int, block_size: int, rounds: int) -> None:
+    settings = Settings(
+        max_history_size=points,
+        compressed_history_size=points,
+        compressed_block_size=block_size
+    )
+    prices = generate_prices("ITEM_00", points)
+
+    with patch('backend.src.repositories.price_repository.get_settings', return_value=settings), \
+            patch('backend.src.repositories.compressed_history.get_settings', return_value=settings):
+        memory_repository = AsyncRWLockPriceRepository()
+        compressed_repository = CompressedPriceRepository()
+
+    await memory_repository.add_prices(prices)
+
+    started = time.perf_counter()
+    await compressed_repository.add_prices(prices)
+    append_seconds = time.perf_counter() - started
+
+    storage = compressed_repository.get_storage_stats()
+    sealed_points = storage["points"] - points % block_size
+    compressed_per_point = storage["compressed_bytes"] / max(sealed_points, 1)
+    object_per_point = price_object_bytes(prices[-1]) + 8  # plus the deque slot
+
+    print(f"points: {points}, block size: {block_size}")
+    print(f"compressed blocks: {compressed_per_point:.2f} bytes/point "
+          f"(raw timestamp + float: 16, Price objects: ~{object_per_point})")
+    print(f"append: {points / append_seconds:,.0f} points/s")
+
+    for name, repository in (("memory", memory_repository), ("compressed", compressed_repository)):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            history = await repository.get_history("ITEM_00")
+        elapsed = (time.perf_counter() - started) / rounds
+        assert len(history) == points
+        print(f"get_history ({name}): {elapsed * 1e3:.1f} ms, {points / elapsed:,.0f} points/s")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        compressed_repository._series["ITEM_00"].points()
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"block decode only (compressed): {elapsed * 1e3:.1f} ms, {points / elapsed:,.0f} points/s")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await compressed_repository.get_history("ITEM_00", limit=100)
+    elapsed = (time.perf_counter() - started) / rounds
+    print(f"get_history limit=100 (compressed): {elapsed * 1e6:.0f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--block-size", type=int, default=512)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.points, args.block_size, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark correlated shock generation against the number of tickers and factors.
+
+Reports the time to draw one round of shocks with the factor model next to
+the independent uniform steps it replaces, and a full generator round with
+each model. Run from the repository root:
+
+    python -m backend.benchmarks.bench_factor_model --tickers 1000 10000 50000 --factors 1 4 16
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Callable, List
+from unittest.mock import patch
+from backend.src.core.config import Settings
+from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
+from backend.src.services.factor_model import FactorModel
+from backend.src.services.price_generator import PriceGenerator
+
+
+def time_per_call(function: Callable[[], object], rounds: int) -> float:
+    """Best-of-rounds wall time of one call, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def independent_steps(ticker_ids: List[str], change_range: float) -> dict:
+    """The generator's independent uniform steps, as a baseline."""
+    uniform = random.uniform
+    return {ticker_id: uniform(-change_range, change_range) for ticker_id in ticker_ids}
+
+
+async def time_generator_round(tickers: int, shock_model: str, factors: int, rounds: int) -> float:
+    """Best-of-rounds wall time of a full PriceGenerator round; nothing subscribes to the events."""
+    settings = Settings(ticker_count=tickers, price_shock_model=shock_model, factor_count=factors)
+    with patch('backend.src.services.price_generator.get_settings', return_value=settings), \
+            patch('backend.src.repositories.price_repository.get_settings', return_value=settings):
+        generator = PriceGenerator(AsyncRWLockPriceRepository())
+    await generator.initialize_tickers()
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await generator._update_all_prices()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--full-round", action="store_true", help="also time full generator rounds")
+    args = parser.parse_args()
+
+    print(f"{'tickers':>8} {'factors':>8} {'draw ms':>9} {'ns/ticker':>10} {'independent ms':>15}")
+    for tickers in args.tickers:
+        ticker_ids = [f"ITEM_{i:05d}" for i in range(tickers)]
+        baseline = time_per_call(lambda: independent_steps(ticker_ids, 1.0), args.rounds)
+        for factors in args.factors:
+            model = FactorModel(factors, 0.5, 1.0, seed=1)
+            for ticker_id in ticker_ids:
+                model.add(ticker_id)
+            elapsed = time_per_call(model.draw, args.rounds)
+            print(f"{tickers:>8} {factors:>8} {elapsed * 1e3:>9.2f} "
+                  f"{elapsed / tickers * 1e9:>10.0f} {baseline * 1e3:>15.2f}")
+
+    if args.full_round:
+        print()
+        print(f"{'tickers':>8} {'model':>12} {'factors':>8} {'round ms':>9}")
+        for tickers in args.tickers:
+            elapsed = asyncio.run(time_generator_round(tickers, "independent", 1, args.rounds))
+            print(f"{tickers:>8} {'independent':>12} {'-':>8} {elapsed * 1e3:>9.2f}")
+            for factors in args.factors:
+                elapsed = asyncio.run(time_generator_round(tickers, "factor", factors, args.rounds))
+                print(f"{tickers:>8} {'factor':>12} {factors:>8} {elapsed * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
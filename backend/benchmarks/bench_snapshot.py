@@ -0,0 +1,117 @@
+"""Benchmark snapshot save and restore against a cold start.
+
+Fills a repository with ``--points`` prices per ticker, then reports the time
+to boot from scratch with ``initialize_tickers``, the time of one save and the
+longest the event loop went without running other tasks during it, and the
+time to restore the saved snapshot into fresh services. Run from the
+repository root:
+
+    python -m backend.benchmarks.bench_snapshot --tickers 10000 100000 --points 10
+    python -m backend.benchmarks.bench_snapshot --tickers 10000 --points 1000 --backend memory compressed
+"""
+import argparse
+import asyncio
+import gc
+import os
+import tempfile
+import time
+from array import array
+from typing import Tuple
+from unittest.mock import patch
+from backend.src.core.config import Settings
+from backend.src.core.timeutils import to_epoch_seconds
+from backend.src.repositories.price_repository import AsyncRWLockPriceRepository, PriceRepositoryProtocol
+from backend.src.repositories.compressed_history import CompressedPriceRepository
+from backend.src.services.price_generator import PriceGenerator
+from backend.src.services.snapshot_service import SnapshotService
+
+
+def make_services(settings: Settings) -> Tuple[PriceGenerator, PriceRepositoryProtocol, SnapshotService]:
+    """Build a generator, repository and snapshot service sharing ``settings``."""
+    with patch('backend.src.repositories.price_repository.get_settings', return_value=settings), \
+            patch('backend.src.repositories.compressed_history.get_settings', return_value=settings), \
+            patch('backend.src.services.price_generator.get_settings', return_value=settings), \
+            patch('backend.src.services.snapshot_service.get_settings', return_value=settings):
+        repository: PriceRepositoryProtocol
+        if settings.history_backend == "compressed":
+            repository = CompressedPriceRepository()
+        else:
+            repository = AsyncRWLockPriceRepository()
+        generator = PriceGenerator(repository)
+        return generator, repository, SnapshotService(generator, repository)
+
+
+async def longest_stall(stop: asyncio.Event) -> float:
+    """Longest gap between turns of a task that yields continuously until stopped."""
+    longest = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        longest = max(longest, now - last)
+        last = now
+    return longest
+
+
+async def run(tickers: int, points: int, backend: str, path: str) -> None:
+    settings = Settings(
+        ticker_count=tickers,
+        max_history_size=max(points, 1),
+        history_backend=backend,
+        compressed_history_size=max(points, 1000),
+        snapshot_path=path
+    )
+
+    generator, repository, snapshot_service = make_services(settings)
+    started = time.perf_counter()
+    await generator.initialize_tickers()
+    cold_start = time.perf_counter() - started
+
+    # Fill the history columnar; generating it round by round would dominate the run
+    start = to_epoch_seconds(generator.get_tickers()[0].created_at)
+    timestamps = array("d", (start + i for i in range(points)))
+    await repository.import_history({
+        ticker.id: (timestamps, array("d", [ticker.current_price]) * points)
+        for ticker in generator.get_tickers()
+    })
+
+    stop = asyncio.Event()
+    stall_task = asyncio.create_task(longest_stall(stop))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await snapshot_service.save()
+    save = time.perf_counter() - started
+    stop.set()
+    stall = await stall_task
+
+    # Restore into a heap like a fresh process's
+    del generator, repository, snapshot_service
+    gc.collect()
+    _, _, restored_service = make_services(settings)
+    started = time.perf_counter()
+    await restored_service.restore()
+    restore = time.perf_counter() - started
+
+    print(f"{tickers:>8} {points:>7} {backend:>11} {cold_start:>8.2f} {stall * 1e3:>9.0f} "
+          f"{save:>7.2f} {restore:>9.2f} {os.path.getsize(path) / 1e6:>8.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--points", type=int, nargs="+", default=[10])
+    parser.add_argument("--backend", choices=["memory", "compressed"], nargs="+", default=["memory"])
+    args = parser.parse_args()
+
+    print(f"{'tickers':>8} {'points':>7} {'backend':>11} {'cold s':>8} {'stall ms':>9} "
+          f"{'save s':>7} {'restore s':>9} {'size MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot.bin")
+        for tickers in args.tickers:
+            for points in args.points:
+                for backend in args.backend:
+                    asyncio.run(run(tickers, points, backend, path))
+
+
+if __name__ == "__main__":
+    main()
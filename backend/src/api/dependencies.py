@@ -1,22 +1,81 @@
+import secrets
 from functools import lru_cache
+from typing import Optional
+from fastapi import Depends, Header, HTTPException
 from backend.src.repositories.price_repository import AsyncRWLockPriceRepository, PriceRepositoryProtocol
+from backend.src.repositories.compressed_history import CompressedPriceRepository
+from backend.src.core.config import get_settings
 from backend.src.services.price_generator import PriceGenerator
+from backend.src.services.indicator_engine import IndicatorEngine
 from backend.src.services.ticker_service import TickerService
+from backend.src.services.snapshot_service import SnapshotService
+from backend.src.services.admission_controller import AdmissionController
+from backend.src.services.broadcast_log import BroadcastHub
 
 
 @lru_cache()
 def get_price_repository() -> PriceRepositoryProtocol:
     """Get price repository instance."""
+    if get_settings().history_backend == "compressed":
+        return CompressedPriceRepository()
     return AsyncRWLockPriceRepository()
 
 
+@lru_cache()
+def get_indicator_engine() -> IndicatorEngine:
+    """Get indicator engine instance."""
+    return IndicatorEngine()
+
+
 @lru_cache()
 def get_price_generator() -> PriceGenerator:
     """Get price generator instance."""
-    return PriceGenerator(get_price_repository())
+    return PriceGenerator(get_price_repository(), get_indicator_engine())
 
 
 @lru_cache()
 def get_ticker_service() -> TickerService:
     """Get ticker service instance."""
-    return TickerService(get_price_generator(), get_price_repository())
\ No newline at end of file
+    return TickerService(get_price_generator(), get_price_repository(), get_indicator_engine())
+
+
+@lru_cache()
+def get_snapshot_service() -> SnapshotService:
+    """Get snapshot service instance."""
+    return SnapshotService(get_price_generator(), get_price_repository())
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController:
+    """Get admission controller instance."""
+    return AdmissionController()
+
+
+@lru_cache()
+def get_broadcast_hub() -> BroadcastHub:
+    """Get broadcast hub instance."""
+    return BroadcastHub()
+
+
+async def shed_load(
+    admission_controller: AdmissionController = Depends(get_admission_controller)
+) -> None:
+    """Reject requests with 503 while the event loop is overloaded."""
+    if admission_controller.overloaded:
+        raise HTTPException(
+            status_code=503,
+            detail=AdmissionController.REJECT_OVERLOADED,
+            headers={"Retry-After": "1"}
+        )
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Require the configured admin token in the X-Admin-Token header.
+
+    The admin API does not exist unless a token is configured.
+    """
+    admin_token = get_settings().admin_token
+    if not admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not secrets.compare_digest((x_admin_token or "").encode(), admin_token.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
@@ -0,0 +1,47 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from backend.src.api.dependencies import get_ticker_service, get_broadcast_hub, require_admin
+from backend.src.services.ticker_service import TickerService
+from backend.src.services.broadcast_log import BroadcastHub
+from backend.src.services.websocket_manager import websocket_manager
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+class TickerCreate(BaseModel):
+    """Request body for adding a ticker."""
+    id: str = Field(..., min_length=1, max_length=64, pattern=r"^[A-Za-z0-9_.\-]+$")
+    # Snapshots store names newline-separated, so control characters are refused
+    name: Optional[str] = Field(None, min_length=1, max_length=128, pattern=r"^[^\x00-\x1f\x7f]+$")
+    initial_price: Optional[float] = Field(None, gt=0)
+
+
+@router.post("/tickers", status_code=201)
+async def add_ticker(
+    body: TickerCreate,
+    ticker_service: TickerService = Depends(get_ticker_service)
+) -> dict:
+    """Add a ticker; it starts ticking with the next generation round."""
+    try:
+        return await ticker_service.add_ticker(body.id, body.name, body.initial_price)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.delete("/tickers/{ticker_id}")
+async def remove_ticker(
+    ticker_id: str,
+    ticker_service: TickerService = Depends(get_ticker_service),
+    broadcast_hub: BroadcastHub = Depends(get_broadcast_hub)
+) -> dict:
+    """Remove a ticker and disconnect its subscribers."""
+    try:
+        ticker = await ticker_service.remove_ticker(ticker_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    broadcast_hub.drop(ticker_id)
+    disconnected = await websocket_manager.drop_ticker(ticker_id)
+    return {"ticker": ticker, "disconnected": disconnected}
@@ -0,0 +1,87 @@
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from backend.src.api.dependencies import (
+    get_ticker_service,
+    get_broadcast_hub,
+    get_admission_controller,
+    shed_load
+)
+from backend.src.core.config import get_settings
+from backend.src.services.ticker_service import TickerService
+from backend.src.services.broadcast_log import BroadcastHub
+from backend.src.services.admission_controller import AdmissionController
+
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+
+@router.get("", dependencies=[Depends(shed_load)])
+async def stream_prices(
+    request: Request,
+    tickers: str = Query(..., description="Comma-separated ticker ids"),
+    last_event_id: Optional[str] = Query(None, description="Resume after this event id"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    ticker_service: TickerService = Depends(get_ticker_service),
+    broadcast_hub: BroadcastHub = Depends(get_broadcast_hub),
+    admission_controller: AdmissionController = Depends(get_admission_controller)
+) -> StreamingResponse:
+    """Stream price updates for one or more tickers as Server-Sent Events."""
+    settings = get_settings()
+
+    ticker_ids: List[str] = list(dict.fromkeys(t for t in tickers.split(",") if t))
+    if not ticker_ids:
+        raise HTTPException(status_code=400, detail="At least one ticker is required")
+    if len(ticker_ids) > settings.sse_max_tickers:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.sse_max_tickers} tickers per stream"
+        )
+    for ticker_id in ticker_ids:
+        if not ticker_service.ticker_exists(ticker_id):
+            raise HTTPException(status_code=404, detail=f"Ticker {ticker_id} not found")
+
+    # The header wins: browsers send it automatically when reconnecting
+    event_id = last_event_id_header or last_event_id
+    cursor = None
+    if event_id is not None:
+        try:
+            cursor = broadcast_hub.parse_event_id(event_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if cursor is None or not broadcast_hub.can_resume(ticker_ids, cursor):
+        # Fresh stream, an id from before a restart, or frames since the id were
+        # already trimmed from the logs: start from live data
+        cursor = broadcast_hub.last_sequence
+
+    client_ip = request.client.host if request.client else "unknown"
+    rejection = admission_controller.admit(client_ip)
+    if rejection:
+        raise HTTPException(status_code=503, detail=rejection, headers={"Retry-After": "1"})
+
+    async def event_stream(cursor: int, ticker_ids: List[str]) -> AsyncIterator[bytes]:
+        yield b"retry: 3000\n\n"
+        while True:
+            entries = broadcast_hub.read(ticker_ids, cursor)
+            if entries:
+                cursor = entries[-1][0]
+                yield b"".join(frame for _, frame in entries)
+                continue
+
+            # Stop following tickers removed at runtime; end the stream once none are left
+            ticker_ids = [t for t in ticker_ids if ticker_service.ticker_exists(t)]
+            if not ticker_ids:
+                return
+            if not await broadcast_hub.wait(ticker_ids, settings.sse_keepalive_interval):
+                yield b": keepalive\n\n"
+
+    return StreamingResponse(
+        event_stream(cursor, ticker_ids),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        },
+        background=BackgroundTask(admission_controller.release, client_ip)
+    )
@@ -1,21 +1,52 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from backend.src.api.dependencies import get_ticker_service
+from datetime import datetime
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from backend.src.api.dependencies import get_ticker_service, shed_load
 from backend.src.services.ticker_service import TickerService
+from backend.src.core.timeutils import to_epoch_seconds
 
 
 router = APIRouter(prefix="/tickers", tags=["tickers"])
 
 
-@router.get("")
+@router.get("", response_model=List[dict])
 async def get_tickers(
+    cursor: Optional[str] = Query(None, description="Last ticker id of the previous page"),
+    limit: int = Query(TickerService.DEFAULT_PAGE_SIZE, ge=1, le=1000),
+    prefix: Optional[str] = Query(None, description="Only tickers whose id starts with this"),
+    if_none_match: Optional[str] = Header(None),
     ticker_service: TickerService = Depends(get_ticker_service)
-) -> List[dict]:
-    """Get list of all available tickers."""
-    return ticker_service.get_all_tickers()
+) -> Response:
+    """Get a page of tickers ordered by id, optionally filtered by prefix.
 
+    The next page's cursor is returned in the ``X-Next-Cursor`` header.
+    """
+    etag = ticker_service.get_listing_etag()
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
 
-@router.get("/{ticker_id}/history")
+    page = ticker_service.get_tickers_page(cursor, limit, prefix)
+    headers = {"ETag": page.etag}
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = page.next_cursor
+    return Response(content=page.body, media_type="application/json", headers=headers)
+
+
+@router.get("/as-of", dependencies=[Depends(shed_load)])
+async def get_prices_as_of(
+    at: datetime = Query(..., description="Point in time (ISO 8601, UTC if no offset)"),
+    ids: Optional[str] = Query(None, description="Comma-separated ticker ids, all tickers if omitted"),
+    ticker_service: TickerService = Depends(get_ticker_service)
+) -> dict:
+    """Get the latest price at or before a point in time for some or all tickers."""
+    ticker_ids = [t for t in ids.split(",") if t] if ids else None
+    try:
+        return await ticker_service.get_prices_as_of(at, ticker_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{ticker_id}/history", dependencies=[Depends(shed_load)])
 async def get_ticker_history(
     ticker_id: str,
     limit: Optional[int] = Query(None, ge=1, le=1000),
@@ -24,5 +55,33 @@ async def get_ticker_history(
     """Get historical data for a specific ticker."""
     try:
         return await ticker_service.get_ticker_history(ticker_id, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{ticker_id}/indicators")
+async def get_ticker_indicators(
+    ticker_id: str,
+    ticker_service: TickerService = Depends(get_ticker_service)
+) -> dict:
+    """Get streaming indicators for a specific ticker."""
+    try:
+        return ticker_service.get_ticker_indicators(ticker_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{ticker_id}/stats", dependencies=[Depends(shed_load)])
+async def get_ticker_stats(
+    ticker_id: str,
+    start: datetime = Query(..., description="Window start (ISO 8601, inclusive)"),
+    end: datetime = Query(..., description="Window end (ISO 8601, inclusive)"),
+    ticker_service: TickerService = Depends(get_ticker_service)
+) -> dict:
+    """Get price statistics for a specific ticker over a time window."""
+    if to_epoch_seconds(start) > to_epoch_seconds(end):
+        raise HTTPException(status_code=400, detail="Window start must not be after its end")
+    try:
+        return await ticker_service.get_ticker_stats(ticker_id, start, end)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
\ No newline at end of file
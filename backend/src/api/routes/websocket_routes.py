@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
 from backend.src.services.websocket_manager import websocket_manager
-from backend.src.api.dependencies import get_ticker_service
+from backend.src.api.dependencies import get_ticker_service, get_admission_controller
 from backend.src.services.ticker_service import TickerService
+from backend.src.services.admission_controller import AdmissionController
 
 router = APIRouter(tags=["websocket"])
 logger = logging.getLogger(__name__)
@@ -13,27 +14,49 @@ logger = logging.getLogger(__name__)
 async def websocket_endpoint(
         websocket: WebSocket,
         ticker_id: str,
-        ticker_service: TickerService = Depends(get_ticker_service)
+        indicators: bool = Query(False),
+        ticker_service: TickerService = Depends(get_ticker_service),
+        admission_controller: AdmissionController = Depends(get_admission_controller)
 ):
     """WebSocket endpoint for real-time price updates."""
     # Validate ticker exists
-    try:
-        await ticker_service.get_ticker_history(ticker_id, limit=1)
-    except ValueError:
+    if not ticker_service.ticker_exists(ticker_id):
         await websocket.close(code=4004, reason="Ticker not found")
         return
 
-    # Connect client
-    await websocket_manager.connect(websocket, ticker_id)
+    # Admission control. A close before accept reaches the client as a bare
+    # HTTP 403, so complete the handshake to deliver 1013 and the reason
+    client_ip = websocket.client.host if websocket.client else "unknown"
+    rejection = admission_controller.admit(client_ip)
+    if rejection:
+        await websocket.accept()
+        await websocket.close(code=1013, reason=rejection)
+        return
 
     try:
+        # Connect client
+        await websocket_manager.connect(websocket, ticker_id, with_indicators=indicators)
+
         # Keep connection alive
         while True:
-            # Wait for any message from client (ping/pong)
+            # Any message from the client (including pongs) counts as activity
             await websocket.receive_text()
+            websocket_manager.touch(websocket)
     except WebSocketDisconnect:
         logger.info(f"Client disconnected from ticker {ticker_id}")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
-        await websocket_manager.disconnect(websocket, ticker_id)
\ No newline at end of file
+        await websocket_manager.disconnect(websocket, ticker_id)
+        admission_controller.release(client_ip)
+
+
+@router.get("/ws/stats")
+async def websocket_stats(
+        admission_controller: AdmissionController = Depends(get_admission_controller)
+) -> dict:
+    """Get WebSocket connection, heartbeat and admission counters."""
+    return {
+        **websocket_manager.get_stats(),
+        "admission": admission_controller.get_stats()
+    }
\ No newline at end of file
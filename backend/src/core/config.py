@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -22,9 +23,45 @@ class Settings(BaseSettings):
     initial_price_min: float = 50.0
     initial_price_max: float = 200.0
     consecutive_errors: int = 10
+    price_shock_model: Literal["independent", "factor"] = "independent"
+    factor_count: int = 4  # common factors in the factor shock model
+    factor_systematic_share: float = 0.5  # share of each ticker's variance from common factors
 
     # History Settings
     max_history_size: int = 1000  # per ticker
+    history_backend: Literal["memory", "compressed"] = "memory"
+    compressed_history_size: int = 100_000  # per ticker, compressed backend only
+    compressed_block_size: int = 512  # points per compressed block
+
+    # Indicator Settings
+    indicator_window: int = 20  # ticks in rolling windows
+    indicator_ema_span: int = 20  # ticks
+
+    # WebSocket Heartbeat Settings
+    ws_heartbeat_interval: float = 15.0  # seconds of silence before a ping
+    ws_idle_timeout: float = 45.0  # seconds of silence before a connection is reaped
+    ws_timer_tick: float = 1.0  # seconds per timer wheel tick
+    ws_timer_wheel_slots: int = 512
+
+    # Admission Control Settings
+    ws_max_connections: int = 100_000
+    ws_max_connections_per_ip: int = 100
+    ws_accept_rate: float = 500.0  # accepted connections per second
+    ws_accept_burst: int = 1000
+    loop_lag_threshold: float = 0.5  # seconds of event loop lag before shedding load
+    loop_lag_interval: float = 0.25  # seconds between event loop lag probes
+
+    # Server-Sent Events Settings
+    sse_log_size: int = 1000  # frames retained per ticker for resume
+    sse_keepalive_interval: float = 15.0  # seconds
+    sse_max_tickers: int = 100  # tickers per stream
+
+    # Snapshot Settings
+    snapshot_path: str = ""  # empty disables snapshots
+    snapshot_interval: float = 30.0  # seconds
+
+    # Admin Settings
+    admin_token: str = ""  # required in X-Admin-Token; the admin API is disabled when empty
 
     # CORS Settings
     cors_origins: list[str] = ["http://localhost:3000", "http://frontend:3000"]
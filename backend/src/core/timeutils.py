@@ -0,0 +1,29 @@
+from datetime import datetime, timedelta, timezone
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(value: datetime) -> float:
+    """Convert a naive UTC (or timezone-aware) datetime to seconds since the Unix epoch."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+
+def from_epoch_seconds(value: float) -> datetime:
+    """Convert seconds since the Unix epoch to a naive UTC datetime."""
+    return EPOCH + timedelta(seconds=value)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Convert a naive UTC (or timezone-aware) datetime to integer microseconds since the Unix epoch."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_epoch_micros(value: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to a naive UTC datetime."""
+    return EPOCH + timedelta(microseconds=value)
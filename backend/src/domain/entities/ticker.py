@@ -20,9 +20,9 @@ class Ticker:
         if self.current_price <= 0:
             raise ValueError("Current price must be positive")
 
-    def update_price(self, new_price: float) -> None:
+    def update_price(self, new_price: float, timestamp: Optional[datetime] = None) -> None:
         """Update the current price of the ticker."""
         if new_price <= 0:
             raise ValueError("Price must be positive")
         self.current_price = new_price
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = timestamp or datetime.utcnow()
\ No newline at end of file
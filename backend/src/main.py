@@ -6,8 +6,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from backend.src.core.config import get_settings
 from backend.src.core.logging import setup_logging
 from backend.src.core.events import event_bus
-from backend.src.api.routes import ticker_routes, websocket_routes
-from backend.src.api.dependencies import get_price_generator
+from backend.src.api.routes import ticker_routes, websocket_routes, stream_routes, admin_routes
+from backend.src.api.dependencies import (
+    get_price_generator,
+    get_indicator_engine,
+    get_snapshot_service,
+    get_admission_controller,
+    get_broadcast_hub
+)
 from backend.src.services.websocket_manager import websocket_manager
 
 logger = logging.getLogger(__name__)
@@ -23,23 +29,40 @@ async def lifespan(app: FastAPI):
 
     # Initialize and start price generator
     price_generator = get_price_generator()
-    await price_generator.initialize_tickers()
+    snapshot_service = get_snapshot_service()
+    if not await snapshot_service.restore():
+        await price_generator.initialize_tickers()
+
+    # Subscribe WebSocket manager and SSE broadcast logs to price updates
+    broadcast_hub = get_broadcast_hub()
 
-    # Subscribe WebSocket manager to price updates
     async def handle_price_update(event):
         await websocket_manager.broadcast_price_update(event)
 
+    async def handle_stream_update(event):
+        broadcast_hub.publish(event)
+
+    websocket_manager.indicator_engine = get_indicator_engine()
     event_bus.subscribe("price_update", handle_price_update)
+    event_bus.subscribe("price_update", handle_stream_update)
+    await websocket_manager.start()
+    admission_controller = get_admission_controller()
+    await admission_controller.start()
 
     # Start price generation
     await price_generator.start()
+    await snapshot_service.start()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Real-Time Price Data System")
     await price_generator.stop()
+    await snapshot_service.stop()
+    await websocket_manager.stop()
+    await admission_controller.stop()
     event_bus.unsubscribe("price_update", handle_price_update)
+    event_bus.unsubscribe("price_update", handle_stream_update)
 
 
 def create_app() -> FastAPI:
@@ -66,6 +89,14 @@ def create_app() -> FastAPI:
         ticker_routes.router,
         prefix=settings.api_prefix
     )
+    app.include_router(
+        stream_routes.router,
+        prefix=settings.api_prefix
+    )
+    app.include_router(
+        admin_routes.router,
+        prefix=settings.api_prefix
+    )
     app.include_router(websocket_routes.router)
 
     @app.get("/health")
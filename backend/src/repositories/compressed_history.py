@@ -0,0 +1,562 @@
+import asyncio
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from backend.src.domain.entities.price import Price
+from backend.src.repositories.price_repository import (
+    EXPORT_BATCH_SIZE,
+    AsyncRWLock,
+    PriceRepositoryProtocol,
+    window_stats
+)
+from backend.src.core.config import get_settings
+from backend.src.core.timeutils import to_epoch_micros, from_epoch_micros
+
+_MASK64 = (1 << 64) - 1
+
+# Delta-of-delta buckets: (prefix, prefix length, payload bits). Anything
+# larger falls through to the '11111' prefix with a full 64-bit payload.
+_DOD_BUCKETS = (
+    (0b10, 2, 7),
+    (0b110, 3, 9),
+    (0b1110, 4, 12),
+    (0b11110, 5, 32),
+)
+
+
+class _BitWriter:
+    """Append-only big-endian bit stream."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value: int, bits: int) -> None:
+        self._acc = (self._acc << bits) | value
+        self._bits += bits
+        if self._bits >= 64:
+            spare = self._bits & 7
+            self._buffer += (self._acc >> spare).to_bytes(self._bits >> 3, "big")
+            self._acc &= (1 << spare) - 1
+            self._bits = spare
+
+    def finish(self) -> bytes:
+        if self._bits:
+            size = (self._bits + 7) >> 3
+            self._buffer += (self._acc << (size * 8 - self._bits)).to_bytes(size, "big")
+            self._acc = 0
+            self._bits = 0
+        return bytes(self._buffer)
+
+
+class _BitReader:
+    """Sequential reader over a big-endian bit stream.
+
+    The stream is unpacked into 64-bit words up front and bits are served
+    from a small integer accumulator that is refilled one word at a time.
+    """
+
+    def __init__(self, data: bytes):
+        words = array("Q")
+        words.frombytes(data + bytes(-len(data) % 8 + 8))
+        if sys.byteorder == "little":
+            words.byteswap()
+        self._words = words
+        self._index = 0
+        self._acc = 0
+        self._bits = 0
+
+    def read(self, bits: int) -> int:
+        if self._bits < bits:
+            self._acc = (self._acc << 64) | self._words[self._index]
+            self._index += 1
+            self._bits += 64
+        self._bits -= bits
+        value = self._acc >> self._bits
+        self._acc &= (1 << self._bits) - 1
+        return value
+
+
+def _signed(value: int, bits: int) -> int:
+    """Interpret ``value`` as a two's complement integer of ``bits`` bits."""
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+def encode_block(timestamps: array, values: array) -> bytes:
+    """Compress a block of microsecond timestamps and float values.
+
+    Timestamps use delta-of-delta encoding and values are XORed with their
+    predecessor, storing only the meaningful bits (Gorilla, VLDB 2015).
+    """
+    value_bits = array("Q")
+    value_bits.frombytes(values.tobytes())
+
+    writer = _BitWriter()
+    write = writer.write
+    write(timestamps[0] & _MASK64, 64)
+    write(value_bits[0], 64)
+
+    previous_timestamp = timestamps[0]
+    previous_delta = 0
+    previous_bits = value_bits[0]
+    previous_leading = -1
+    previous_trailing = 0
+
+    for i in range(1, len(timestamps)):
+        timestamp = timestamps[i]
+        delta = timestamp - previous_timestamp
+        dod = delta - previous_delta
+        previous_timestamp = timestamp
+        previous_delta = delta
+
+        if dod == 0:
+            write(0, 1)
+        else:
+            for prefix, prefix_bits, bits in _DOD_BUCKETS:
+                half = 1 << (bits - 1)
+                if -half <= dod < half:
+                    write(prefix, prefix_bits)
+                    write(dod & ((1 << bits) - 1), bits)
+                    break
+            else:
+                write(0b11111, 5)
+                write(dod & _MASK64, 64)
+
+        bits = value_bits[i]
+        xor = bits ^ previous_bits
+        previous_bits = bits
+        if xor == 0:
+            write(0, 1)
+            continue
+
+        leading = min(64 - xor.bit_length(), 31)
+        trailing = (xor & -xor).bit_length() - 1
+        if previous_leading >= 0 and leading >= previous_leading and trailing >= previous_trailing:
+            # Fits in the previous meaningful-bit window
+            write(0b10, 2)
+            write(xor >> previous_trailing, 64 - previous_leading - previous_trailing)
+        else:
+            meaningful = 64 - leading - trailing
+            write(0b11, 2)
+            write(leading, 5)
+            write(meaningful & 63, 6)
+            write(xor >> trailing, meaningful)
+            previous_leading = leading
+            previous_trailing = trailing
+
+    return writer.finish()
+
+
+def decode_block(data: bytes, count: int) -> Tuple[array, array]:
+    """Decompress a block produced by ``encode_block``."""
+    reader = _BitReader(data)
+    read = reader.read
+
+    timestamp = _signed(read(64), 64)
+    bits = read(64)
+    timestamps = array("q", [timestamp])
+    value_bits = array("Q", [bits])
+
+    delta = 0
+    leading = 0
+    trailing = 0
+    for _ in range(count - 1):
+        if read(1):
+            if not read(1):
+                size = 7
+            elif not read(1):
+                size = 9
+            elif not read(1):
+                size = 12
+            elif not read(1):
+                size = 32
+            else:
+                size = 64
+            delta += _signed(read(size), size)
+        timestamp += delta
+        timestamps.append(timestamp)
+
+        if read(1):
+            if read(1):
+                leading = read(5)
+                meaningful = read(6) or 64
+                trailing = 64 - leading - meaningful
+            bits ^= read(64 - leading - trailing) << trailing
+        value_bits.append(bits)
+
+    values = array("d")
+    values.frombytes(value_bits.tobytes())
+    return timestamps, values
+
+
+@dataclass(frozen=True)
+class _Block:
+    """A sealed, compressed block of points."""
+
+    data: bytes
+    count: int
+    first_timestamp: int
+    last_timestamp: int
+
+
+class CompressedSeries:
+    """Price series of one ticker stored as compressed blocks.
+
+    Points accumulate in an uncompressed head block that is sealed once it
+    holds ``block_size`` points, so appends and latest-price reads never
+    touch compressed data. Points are kept sorted by timestamp; see
+    ``append`` for points that arrive out of order.
+    """
+
+    def __init__(self, block_size: int, capacity: int):
+        if block_size <= 0:
+            raise ValueError("Block size must be positive")
+        if capacity < block_size:
+            raise ValueError("Capacity must be at least one block")
+
+        self.block_size = block_size
+        self.capacity = capacity
+        self._blocks: List[_Block] = []
+        self._block_starts: List[int] = []
+        self._sealed_count = 0
+        self._head_timestamps = array("q")
+        self._head_values = array("d")
+        self._latest: Optional[Tuple[int, float]] = None
+
+    def __len__(self) -> int:
+        return min(self._sealed_count + len(self._head_values), self.capacity)
+
+    @property
+    def compressed_bytes(self) -> int:
+        """Size of the sealed block payloads."""
+        return sum(len(block.data) for block in self._blocks)
+
+    def append(self, timestamp: int, value: float) -> None:
+        """Add a point, sealing the head block when it is full.
+
+        Out-of-order points (wall clock steps) are inserted in place within
+        the head block. Sealed blocks are immutable, so a point older than
+        the head is stored at the head's earliest timestamp instead.
+        """
+        head_timestamps = self._head_timestamps
+        if head_timestamps:
+            floor = head_timestamps[0]
+        elif self._blocks:
+            floor = self._blocks[-1].last_timestamp
+        else:
+            floor = timestamp
+        timestamp = max(timestamp, floor)
+
+        if head_timestamps and timestamp < head_timestamps[-1]:
+            index = bisect_right(head_timestamps, timestamp)
+            head_timestamps.insert(index, timestamp)
+            self._head_values.insert(index, value)
+        else:
+            head_timestamps.append(timestamp)
+            self._head_values.append(value)
+        self._latest = (timestamp, value)
+        if len(self._head_values) >= self.block_size:
+            self._seal()
+        self._trim()
+
+    def extend(self, timestamps: array, values: array) -> None:
+        """Add sorted points in bulk, filling and sealing whole head blocks at a time."""
+        if not values:
+            return
+        if self._latest is not None and timestamps[0] < self._latest[0]:
+            for timestamp, value in zip(timestamps, values):
+                self.append(timestamp, value)
+            return
+
+        position = 0
+        while position < len(values):
+            end = position + self.block_size - len(self._head_values)
+            self._head_timestamps.extend(timestamps[position:end])
+            self._head_values.extend(values[position:end])
+            position = end
+            if len(self._head_values) >= self.block_size:
+                self._seal()
+        self._latest = (timestamps[-1], values[-1])
+        self._trim()
+
+    def latest(self) -> Optional[Tuple[int, float]]:
+        """Get the most recent point."""
+        return self._latest
+
+    def points(self, limit: Optional[int] = None) -> Tuple[array, array]:
+        """Get the most recent ``limit`` points (all retained points if None)."""
+        wanted = len(self) if limit is None else min(limit, len(self))
+
+        # Decode only as many blocks, newest first, as the limit requires
+        chunks = []
+        available = len(self._head_values)
+        for block in reversed(self._blocks):
+            if available >= wanted:
+                break
+            chunks.append(decode_block(block.data, block.count))
+            available += block.count
+
+        timestamps = array("q")
+        values = array("d")
+        for block_timestamps, block_values in reversed(chunks):
+            timestamps.extend(block_timestamps)
+            values.extend(block_values)
+        timestamps.extend(self._head_timestamps)
+        values.extend(self._head_values)
+
+        start = len(values) - wanted
+        return timestamps[start:], values[start:]
+
+    def as_of(self, timestamp: int) -> Optional[Tuple[int, float]]:
+        """Get the latest point at or before ``timestamp``."""
+        if self._head_timestamps and self._head_timestamps[0] <= timestamp:
+            index = bisect_right(self._head_timestamps, timestamp) - 1
+            return self._head_timestamps[index], self._head_values[index]
+
+        block_index = bisect_right(self._block_starts, timestamp) - 1
+        if block_index < 0:
+            return None
+        block = self._blocks[block_index]
+        timestamps, values = decode_block(block.data, block.count)
+        index = bisect_right(timestamps, timestamp) - 1
+        if block_index == 0 and index < self._expired():
+            return None
+        return timestamps[index], values[index]
+
+    def window(self, start: int, end: int) -> Tuple[array, array]:
+        """Get the points with ``start <= timestamp <= end``."""
+        timestamps = array("q")
+        values = array("d")
+
+        # Step back one block: the block before the first one starting at or after
+        # ``start`` may still end at or after it, including on equal timestamps
+        first_block = max(0, bisect_left(self._block_starts, start) - 1)
+        for block_index in range(first_block, len(self._blocks)):
+            block = self._blocks[block_index]
+            if block.first_timestamp > end:
+                break
+            if block.last_timestamp < start:
+                continue
+            block_timestamps, block_values = decode_block(block.data, block.count)
+            lo = bisect_left(block_timestamps, start)
+            if block_index == 0:
+                lo = max(lo, self._expired())
+            hi = bisect_right(block_timestamps, end)
+            timestamps.extend(block_timestamps[lo:hi])
+            values.extend(block_values[lo:hi])
+
+        lo = bisect_left(self._head_timestamps, start)
+        hi = bisect_right(self._head_timestamps, end)
+        timestamps.extend(self._head_timestamps[lo:hi])
+        values.extend(self._head_values[lo:hi])
+        return timestamps, values
+
+    def _trim(self) -> None:
+        """Drop whole blocks once the remaining points still cover the capacity."""
+        total = self._sealed_count + len(self._head_values)
+        while self._blocks and total - self._blocks[0].count >= self.capacity:
+            total -= self._blocks[0].count
+            self._sealed_count -= self._blocks[0].count
+            del self._blocks[0]
+            del self._block_starts[0]
+
+    def _expired(self) -> int:
+        """Number of points at the start of the oldest block past the retention limit."""
+        return max(0, self._sealed_count + len(self._head_values) - self.capacity)
+
+    def _seal(self) -> None:
+        """Compress the head block."""
+        timestamps = self._head_timestamps
+        block = _Block(
+            data=encode_block(timestamps, self._head_values),
+            count=len(timestamps),
+            first_timestamp=timestamps[0],
+            last_timestamp=timestamps[-1]
+        )
+        self._blocks.append(block)
+        self._block_starts.append(block.first_timestamp)
+        self._sealed_count += block.count
+        self._head_timestamps = array("q")
+        self._head_values = array("d")
+
+
+class CompressedPriceRepository(PriceRepositoryProtocol):
+    """Price repository keeping long histories in compressed blocks."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        if self.settings.compressed_history_size < self.settings.compressed_block_size:
+            raise ValueError("compressed_history_size must be at least compressed_block_size")
+        self._series: Dict[str, CompressedSeries] = defaultdict(
+            lambda: CompressedSeries(
+                self.settings.compressed_block_size,
+                self.settings.compressed_history_size
+            )
+        )
+        self._rw_lock = AsyncRWLock()
+
+    async def add_price(self, price: Price) -> None:
+        """Add a new price to the history."""
+        await self._rw_lock.acquire_write()
+        try:
+            self._series[price.ticker_id].append(to_epoch_micros(price.timestamp), price.value)
+        finally:
+            self._rw_lock.release_write()
+
+    async def add_prices(self, prices: Iterable[Price]) -> None:
+        """Add a batch of prices under a single write lock."""
+        await self._rw_lock.acquire_write()
+        try:
+            series = self._series
+            last_timestamp = None
+            micros = 0
+            for price in prices:
+                if price.timestamp != last_timestamp:
+                    last_timestamp = price.timestamp
+                    micros = to_epoch_micros(last_timestamp)
+                series[price.ticker_id].append(micros, price.value)
+        finally:
+            self._rw_lock.release_write()
+
+    async def get_history(self, ticker_id: str, limit: Optional[int] = None) -> List[Price]:
+        """Get price history for a ticker."""
+        await self._rw_lock.acquire_read()
+        try:
+            series = self._series.get(ticker_id)
+            if series is None:
+                return []
+            timestamps, values = series.points(limit)
+        finally:
+            await self._rw_lock.release_read()
+
+        return _to_prices(ticker_id, timestamps, values)
+
+    async def get_latest_price(self, ticker_id: str) -> Optional[Price]:
+        """Get the latest price for a ticker."""
+        await self._rw_lock.acquire_read()
+        try:
+            series = self._series.get(ticker_id)
+            point = series.latest() if series is not None else None
+        finally:
+            await self._rw_lock.release_read()
+
+        if point is None:
+            return None
+        return Price(ticker_id=ticker_id, value=point[1], timestamp=from_epoch_micros(point[0]))
+
+    async def clear_history(self, ticker_id: str) -> None:
+        """Clear history for a specific ticker."""
+        await self._rw_lock.acquire_write()
+        try:
+            self._series.pop(ticker_id, None)
+        finally:
+            self._rw_lock.release_write()
+
+    async def export_history(self, limit: Optional[int] = None) -> Dict[str, Tuple[array, array]]:
+        """Get a copy of the most recent ``limit`` prices of every ticker.
+
+        Points are returned as epoch-second timestamp and value arrays. Each
+        ticker is consistent, but tickers are decoded in batches and price
+        updates may land between batches.
+        """
+        history: Dict[str, Tuple[array, array]] = {}
+        ticker_ids = list(self._series)
+        for start in range(0, len(ticker_ids), EXPORT_BATCH_SIZE):
+            await self._rw_lock.acquire_read()
+            try:
+                for ticker_id in ticker_ids[start:start + EXPORT_BATCH_SIZE]:
+                    series = self._series.get(ticker_id)
+                    if series is None or not len(series):
+                        continue
+                    timestamps, values = series.points(limit)
+                    history[ticker_id] = (array("d", (t / 1_000_000 for t in timestamps)), values)
+            finally:
+                await self._rw_lock.release_read()
+            # Let waiting writers take the lock before the next batch
+            await asyncio.sleep(0)
+        return history
+
+    async def import_history(self, history: Dict[str, Tuple[array, array]]) -> None:
+        """Load epoch-second timestamp and value arrays, such as a restored snapshot."""
+        await self._rw_lock.acquire_write()
+        try:
+            series = self._series
+            for ticker_id, (timestamps, values) in history.items():
+                micros = array("q", (round(timestamp * 1_000_000) for timestamp in timestamps))
+                series[ticker_id].extend(micros, values)
+        finally:
+            self._rw_lock.release_write()
+
+    async def get_prices_as_of(
+        self,
+        at: datetime,
+        ticker_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[Price]]:
+        """Get the latest price at or before ``at`` for the given tickers (all if None)."""
+        timestamp = to_epoch_micros(at)
+        await self._rw_lock.acquire_read()
+        try:
+            if ticker_ids is None:
+                ticker_ids = list(self._series)
+
+            result: Dict[str, Optional[Price]] = {}
+            for ticker_id in ticker_ids:
+                series = self._series.get(ticker_id)
+                point = series.as_of(timestamp) if series is not None else None
+                result[ticker_id] = None if point is None else Price(
+                    ticker_id=ticker_id,
+                    value=point[1],
+                    timestamp=from_epoch_micros(point[0])
+                )
+            return result
+        finally:
+            await self._rw_lock.release_read()
+
+    async def get_window_stats(
+        self,
+        ticker_id: str,
+        start: datetime,
+        end: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Get summary statistics of the prices between ``start`` and ``end`` inclusive."""
+        await self._rw_lock.acquire_read()
+        try:
+            series = self._series.get(ticker_id)
+            if series is None:
+                return None
+            timestamps, values = series.window(to_epoch_micros(start), to_epoch_micros(end))
+        finally:
+            await self._rw_lock.release_read()
+
+        if not values:
+            return None
+        return window_stats(
+            values,
+            from_epoch_micros(timestamps[0]),
+            from_epoch_micros(timestamps[-1])
+        )
+
+    def get_storage_stats(self) -> Dict[str, int]:
+        """Get the number of retained points and compressed bytes across tickers."""
+        series = list(self._series.values())
+        return {
+            "points": sum(len(s) for s in series),
+            "compressed_bytes": sum(s.compressed_bytes for s in series)
+        }
+
+
+def _to_prices(ticker_id: str, timestamps: array, values: array) -> List[Price]:
+    """Build price entities, converting each distinct timestamp once."""
+    datetimes: Dict[int, datetime] = {}
+    prices = []
+    for timestamp, value in zip(timestamps, values):
+        moment = datetimes.get(timestamp)
+        if moment is None:
+            moment = datetimes[timestamp] = from_epoch_micros(timestamp)
+        prices.append(Price(ticker_id=ticker_id, value=value, timestamp=moment))
+    return prices
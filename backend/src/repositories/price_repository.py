@@ -1,8 +1,15 @@
-from typing import List, Dict, Optional, Protocol
+from typing import Any, List, Dict, Iterable, Optional, Protocol, Sequence, Tuple
+from array import array
 from collections import defaultdict, deque
+from datetime import datetime
 import asyncio
 from backend.src.domain.entities.price import Price
+from backend.src.repositories.timestamp_index import TimestampIndex
 from backend.src.core.config import get_settings
+from backend.src.core.timeutils import to_epoch_seconds, from_epoch_seconds
+
+# Tickers copied per read lock during an export, so writers can run in between
+EXPORT_BATCH_SIZE = 1000
 
 
 class PriceRepositoryProtocol(Protocol):
@@ -10,12 +17,31 @@ class PriceRepositoryProtocol(Protocol):
 
     async def add_price(self, price: Price) -> None: ...
 
+    async def add_prices(self, prices: Iterable[Price]) -> None: ...
+
     async def get_history(self, ticker_id: str, limit: Optional[int] = None) -> List[Price]: ...
 
     async def get_latest_price(self, ticker_id: str) -> Optional[Price]: ...
 
     async def clear_history(self, ticker_id: str) -> None: ...
 
+    async def export_history(self, limit: Optional[int] = None) -> Dict[str, Tuple[array, array]]: ...
+
+    async def import_history(self, history: Dict[str, Tuple[array, array]]) -> None: ...
+
+    async def get_prices_as_of(
+        self,
+        at: datetime,
+        ticker_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[Price]]: ...
+
+    async def get_window_stats(
+        self,
+        ticker_id: str,
+        start: datetime,
+        end: datetime
+    ) -> Optional[Dict[str, Any]]: ...
+
 
 class AsyncRWLock:
     """Async read-write lock implementation."""
@@ -59,6 +85,10 @@ class AsyncRWLockPriceRepository(PriceRepositoryProtocol):
         self._history: Dict[str, deque] = defaultdict(
             lambda: deque(maxlen=self.settings.max_history_size)
         )
+        # Sorted timestamp arrays per ticker for as-of and window queries
+        self._indexes: Dict[str, TimestampIndex] = defaultdict(
+            lambda: TimestampIndex(self.settings.max_history_size)
+        )
         self._rw_lock = AsyncRWLock()
 
     async def add_price(self, price: Price) -> None:
@@ -66,6 +96,25 @@ class AsyncRWLockPriceRepository(PriceRepositoryProtocol):
         await self._rw_lock.acquire_write()
         try:
             self._history[price.ticker_id].append(price)
+            self._indexes[price.ticker_id].append(to_epoch_seconds(price.timestamp), price.value)
+        finally:
+            self._rw_lock.release_write()
+
+    async def add_prices(self, prices: Iterable[Price]) -> None:
+        """Add a batch of prices under a single write lock."""
+        await self._rw_lock.acquire_write()
+        try:
+            history = self._history
+            indexes = self._indexes
+            # Batches are usually stamped with one timestamp; convert it once
+            last_timestamp = None
+            epoch_seconds = 0.0
+            for price in prices:
+                history[price.ticker_id].append(price)
+                if price.timestamp != last_timestamp:
+                    last_timestamp = price.timestamp
+                    epoch_seconds = to_epoch_seconds(last_timestamp)
+                indexes[price.ticker_id].append(epoch_seconds, price.value)
         finally:
             self._rw_lock.release_write()
 
@@ -74,6 +123,15 @@ class AsyncRWLockPriceRepository(PriceRepositoryProtocol):
         await self._rw_lock.acquire_read()
         try:
             history = list(self._history.get(ticker_id, []))
+            # Imported points are only kept in the index, ahead of the deque
+            index = self._indexes.get(ticker_id)
+            if index is not None and len(index) > len(history):
+                imported = len(index) - len(history)
+                if limit:
+                    imported = min(imported, limit - len(history))
+                if imported > 0:
+                    timestamps, values = index.points(imported + len(history))
+                    history = _to_prices(ticker_id, timestamps[:imported], values[:imported]) + history
             if limit:
                 return history[-limit:]
             return history
@@ -87,6 +145,10 @@ class AsyncRWLockPriceRepository(PriceRepositoryProtocol):
             history = self._history.get(ticker_id)
             if history:
                 return history[-1]
+            index = self._indexes.get(ticker_id)
+            point = index.latest() if index is not None else None
+            if point is not None:
+                return Price(ticker_id=ticker_id, value=point[1], timestamp=from_epoch_seconds(point[0]))
             return None
         finally:
             await self._rw_lock.release_read()
@@ -95,7 +157,124 @@ class AsyncRWLockPriceRepository(PriceRepositoryProtocol):
         """Clear history for a specific ticker."""
         await self._rw_lock.acquire_write()
         try:
-            if ticker_id in self._history:
-                self._history[ticker_id].clear()
+            self._history.pop(ticker_id, None)
+            self._indexes.pop(ticker_id, None)
+        finally:
+            self._rw_lock.release_write()
+
+    async def export_history(self, limit: Optional[int] = None) -> Dict[str, Tuple[array, array]]:
+        """Get a copy of the most recent ``limit`` prices of every ticker.
+
+        Points are returned as epoch-second timestamp and value arrays copied
+        straight from the timestamp indexes. Each ticker is consistent, but
+        tickers are copied in batches and price updates may land between them.
+        """
+        history: Dict[str, Tuple[array, array]] = {}
+        ticker_ids = list(self._indexes)
+        for start in range(0, len(ticker_ids), EXPORT_BATCH_SIZE):
+            await self._rw_lock.acquire_read()
+            try:
+                for ticker_id in ticker_ids[start:start + EXPORT_BATCH_SIZE]:
+                    index = self._indexes.get(ticker_id)
+                    if index is not None and len(index):
+                        history[ticker_id] = index.points(limit)
+            finally:
+                await self._rw_lock.release_read()
+            # Let waiting writers take the lock before the next batch
+            await asyncio.sleep(0)
+        return history
+
+    async def import_history(self, history: Dict[str, Tuple[array, array]]) -> None:
+        """Load epoch-second timestamp and value arrays older than any stored prices.
+
+        Imported points only go into the timestamp indexes; their Price
+        objects are built when they are read.
+        """
+        await self._rw_lock.acquire_write()
+        try:
+            indexes = self._indexes
+            for ticker_id, (timestamps, values) in history.items():
+                if values:
+                    indexes[ticker_id].extend(timestamps, values)
         finally:
             self._rw_lock.release_write()
+
+    async def get_prices_as_of(
+        self,
+        at: datetime,
+        ticker_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[Price]]:
+        """Get the latest price at or before ``at`` for the given tickers (all if None)."""
+        timestamp = to_epoch_seconds(at)
+        await self._rw_lock.acquire_read()
+        try:
+            if ticker_ids is None:
+                ticker_ids = list(self._indexes)
+
+            result: Dict[str, Optional[Price]] = {}
+            for ticker_id in ticker_ids:
+                index = self._indexes.get(ticker_id)
+                point = index.as_of(timestamp) if index is not None else None
+                result[ticker_id] = None if point is None else Price(
+                    ticker_id=ticker_id,
+                    value=point[1],
+                    timestamp=from_epoch_seconds(point[0])
+                )
+            return result
+        finally:
+            await self._rw_lock.release_read()
+
+    async def get_window_stats(
+        self,
+        ticker_id: str,
+        start: datetime,
+        end: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Get summary statistics of the prices between ``start`` and ``end`` inclusive."""
+        await self._rw_lock.acquire_read()
+        try:
+            index = self._indexes.get(ticker_id)
+            if index is None:
+                return None
+            timestamps, values = index.window(to_epoch_seconds(start), to_epoch_seconds(end))
+        finally:
+            await self._rw_lock.release_read()
+
+        if not values:
+            return None
+        return window_stats(
+            values,
+            from_epoch_seconds(timestamps[0]),
+            from_epoch_seconds(timestamps[-1])
+        )
+
+
+def _to_prices(ticker_id: str, timestamps: array, values: array) -> List[Price]:
+    """Build price entities from epoch seconds, converting each distinct timestamp once."""
+    datetimes: Dict[float, datetime] = {}
+    prices = []
+    for timestamp, value in zip(timestamps, values):
+        moment = datetimes.get(timestamp)
+        if moment is None:
+            moment = datetimes[timestamp] = from_epoch_seconds(timestamp)
+        prices.append(Price(ticker_id=ticker_id, value=value, timestamp=moment))
+    return prices
+
+
+def window_stats(
+    values: Sequence[float],
+    first_timestamp: datetime,
+    last_timestamp: datetime
+) -> Dict[str, Any]:
+    """Summarize a non-empty window of prices ordered by time."""
+    return {
+        "count": len(values),
+        "first_timestamp": first_timestamp,
+        "last_timestamp": last_timestamp,
+        "open": values[0],
+        "close": values[-1],
+        "high": max(values),
+        "low": min(values),
+        "mean": sum(values) / len(values),
+        "change": values[-1] - values[0]
+    }
@@ -0,0 +1,88 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional, Tuple
+
+
+class TimestampIndex:
+    """Sorted timestamps and values of one ticker for point-in-time lookups.
+
+    Timestamps are epoch seconds kept in a flat ``array`` so lookups are a
+    C-level binary search. Like the history deque, the index is bounded; old
+    entries are dropped from the front and compacted lazily so appends stay
+    amortized O(1).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._timestamps = array("d")
+        self._values = array("d")
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._timestamps) - self._start
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a point, keeping timestamps sorted."""
+        timestamps = self._timestamps
+        if len(self) and timestamp < timestamps[-1]:
+            # Out-of-order points are rare (clock adjustments); insert in place
+            index = bisect_right(timestamps, timestamp, lo=self._start)
+            timestamps.insert(index, timestamp)
+            self._values.insert(index, value)
+        else:
+            timestamps.append(timestamp)
+            self._values.append(value)
+
+        if len(self) > self.capacity:
+            self._start += 1
+            if self._start >= self.capacity:
+                del timestamps[:self._start]
+                del self._values[:self._start]
+                self._start = 0
+
+    def extend(self, timestamps: array, values: array) -> None:
+        """Add sorted points in bulk, keeping the most recent ``capacity``."""
+        current = self._timestamps
+        if len(current) > self._start and timestamps and timestamps[0] < current[-1]:
+            for timestamp, value in zip(timestamps, values):
+                self.append(timestamp, value)
+            return
+
+        current.extend(timestamps)
+        self._values.extend(values)
+        if len(current) - self._start > self.capacity:
+            self._start = len(current) - self.capacity
+            if self._start >= self.capacity:
+                del self._timestamps[:self._start]
+                del self._values[:self._start]
+                self._start = 0
+
+    def points(self, limit: Optional[int] = None) -> Tuple[array, array]:
+        """Get copies of the most recent ``limit`` points (all if None)."""
+        start = self._start if not limit else max(self._start, len(self._timestamps) - limit)
+        return self._timestamps[start:], self._values[start:]
+
+    def clear(self) -> None:
+        """Remove all points."""
+        self._timestamps = array("d")
+        self._values = array("d")
+        self._start = 0
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        """Get the most recent ``(timestamp, value)``."""
+        if not len(self):
+            return None
+        return self._timestamps[-1], self._values[-1]
+
+    def as_of(self, timestamp: float) -> Optional[Tuple[float, float]]:
+        """Get the latest ``(timestamp, value)`` at or before ``timestamp``."""
+        index = bisect_right(self._timestamps, timestamp, lo=self._start) - 1
+        if index < self._start:
+            return None
+        return self._timestamps[index], self._values[index]
+
+    def window(self, start: float, end: float) -> Tuple[array, array]:
+        """Get the timestamps and values with ``start <= timestamp <= end``."""
+        lo = bisect_left(self._timestamps, start, lo=self._start)
+        hi = bisect_right(self._timestamps, end, lo=lo)
+        return self._timestamps[lo:hi], self._values[lo:hi]
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+from backend.src.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Rate and burst must be positive")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class AdmissionController:
+    """Admission control and load shedding for client connections.
+
+    WebSocket accepts are paced with a token bucket and capped globally and
+    per client address. A background probe measures event loop lag; while it
+    is above the threshold the node sheds new work instead of letting it
+    stall price generation.
+    """
+
+    REJECT_OVERLOADED = "Server overloaded"
+    REJECT_CAPACITY = "Server at capacity"
+    REJECT_PER_IP = "Too many connections from this address"
+    REJECT_RATE = "Connection rate limit exceeded"
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._bucket = TokenBucket(self.settings.ws_accept_rate, self.settings.ws_accept_burst)
+        self._connections = 0
+        self._connections_by_ip: Dict[str, int] = {}
+        self._rejections: Dict[str, int] = defaultdict(int)
+        self._loop_lag = 0.0
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loop_lag(self) -> float:
+        """Most recently measured event loop lag in seconds."""
+        return self._loop_lag
+
+    @property
+    def overloaded(self) -> bool:
+        """Whether event loop lag is above the shedding threshold."""
+        return self._loop_lag >= self.settings.loop_lag_threshold
+
+    def admit(self, client_ip: str) -> Optional[str]:
+        """Try to admit a connection, returning the rejection reason if refused."""
+        reason = None
+        if self.overloaded:
+            reason = self.REJECT_OVERLOADED
+        elif self._connections >= self.settings.ws_max_connections:
+            reason = self.REJECT_CAPACITY
+        elif self._connections_by_ip.get(client_ip, 0) >= self.settings.ws_max_connections_per_ip:
+            reason = self.REJECT_PER_IP
+        elif not self._bucket.try_acquire():
+            reason = self.REJECT_RATE
+
+        if reason:
+            self._rejections[reason] += 1
+            return reason
+
+        self._connections += 1
+        self._connections_by_ip[client_ip] = self._connections_by_ip.get(client_ip, 0) + 1
+        return None
+
+    def release(self, client_ip: str) -> None:
+        """Release a previously admitted connection."""
+        count = self._connections_by_ip.get(client_ip, 0)
+        if count <= 0:
+            return
+
+        self._connections -= 1
+        if count == 1:
+            del self._connections_by_ip[client_ip]
+        else:
+            self._connections_by_ip[client_ip] = count - 1
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get admission counters."""
+        return {
+            "connections": self._connections,
+            "loop_lag": self._loop_lag,
+            "overloaded": self.overloaded,
+            "rejections": dict(self._rejections)
+        }
+
+    async def start(self) -> None:
+        """Start probing event loop lag."""
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._probe_loop_lag())
+        logger.info("Admission controller started")
+
+    async def stop(self) -> None:
+        """Stop probing event loop lag."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Admission controller stopped")
+
+    async def _probe_loop_lag(self) -> None:
+        """Measure how late a sleep of a known length wakes up."""
+        interval = self.settings.loop_lag_interval
+        while self._running:
+            started = time.monotonic()
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.monotonic() - started - interval)
+
+            was_overloaded = self.overloaded
+            self._loop_lag = lag
+            if self.overloaded != was_overloaded:
+                if self.overloaded:
+                    logger.warning(f"Event loop lag {lag:.3f}s above threshold, shedding load")
+                else:
+                    logger.info("Event loop lag back below threshold")
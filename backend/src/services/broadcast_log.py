@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+import json
+import secrets
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from backend.src.domain.events.price_events import PriceUpdateEvent
+from backend.src.core.config import get_settings
+
+
+class BroadcastLog:
+    """Bounded append-only log of pre-encoded frames for a single ticker.
+
+    Frames are encoded once on append and shared by every reader; readers
+    only keep an integer cursor and get back references to the same bytes.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._sequences: List[int] = []
+        self._frames: List[bytes] = []
+        self._start = 0
+        # Highest sequence dropped from the front of the log
+        self.trimmed_through = 0
+        self._waiters: Set[asyncio.Future] = set()
+
+    def __len__(self) -> int:
+        return len(self._sequences) - self._start
+
+    def append(self, sequence: int, frame: bytes) -> None:
+        """Append a frame and wake all waiting readers."""
+        self._sequences.append(sequence)
+        self._frames.append(frame)
+
+        if len(self) > self.capacity:
+            self.trimmed_through = self._sequences[self._start]
+            self._start += 1
+            # Compact lazily so trimming stays amortized O(1)
+            if self._start >= self.capacity:
+                del self._sequences[:self._start]
+                del self._frames[:self._start]
+                self._start = 0
+
+        self.notify()
+
+    def notify(self) -> None:
+        """Wake all waiting readers."""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    def read_after(self, cursor: int) -> List[Tuple[int, bytes]]:
+        """Get all retained frames with a sequence greater than ``cursor``."""
+        index = bisect_right(self._sequences, cursor, lo=self._start)
+        return list(zip(self._sequences[index:], self._frames[index:]))
+
+    def add_waiter(self, waiter: asyncio.Future) -> None:
+        """Register a future to be resolved on the next append."""
+        self._waiters.add(waiter)
+
+    def remove_waiter(self, waiter: asyncio.Future) -> None:
+        """Unregister a waiting future."""
+        self._waiters.discard(waiter)
+
+
+class BroadcastHub:
+    """Per-ticker broadcast logs sharing one global sequence.
+
+    The global sequence doubles as the SSE event id, so a single
+    ``Last-Event-ID`` value is a valid resume cursor for any set of tickers.
+    Event ids are prefixed with a per-process boot token because the
+    sequence restarts at 1 with every process.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.boot_token = secrets.token_hex(4)
+        self._logs: Dict[str, BroadcastLog] = {}
+        self._sequence = 0
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence of the most recently published frame."""
+        return self._sequence
+
+    def publish(self, event: PriceUpdateEvent) -> None:
+        """Encode a price update once and append it to its ticker's log."""
+        self._sequence += 1
+        frame = (
+            f"id: {self.boot_token}-{self._sequence}\n"
+            f"event: price_update\n"
+            f"data: {json.dumps(event.to_dict())}\n\n"
+        ).encode("utf-8")
+        self._log(event.ticker_id).append(self._sequence, frame)
+
+    def parse_event_id(self, event_id: str) -> Optional[int]:
+        """Get the sequence of an event id, or None if another process issued it."""
+        boot_token, _, sequence = event_id.rpartition("-")
+        if not boot_token or not sequence.isdigit():
+            raise ValueError(f"Invalid event id {event_id}")
+        if boot_token != self.boot_token:
+            return None
+        return int(sequence)
+
+    def can_resume(self, ticker_ids: Iterable[str], cursor: int) -> bool:
+        """Check that no frame after ``cursor`` was trimmed from the tickers' logs."""
+        if cursor > self._sequence:
+            return False
+        return all(
+            self._logs[ticker_id].trimmed_through <= cursor
+            for ticker_id in ticker_ids
+            if ticker_id in self._logs
+        )
+
+    def read(self, ticker_ids: Iterable[str], cursor: int) -> List[Tuple[int, bytes]]:
+        """Get frames after ``cursor`` for the given tickers in sequence order."""
+        entries = [
+            self._logs[ticker_id].read_after(cursor)
+            for ticker_id in ticker_ids
+            if ticker_id in self._logs
+        ]
+        if len(entries) == 1:
+            return entries[0]
+        return list(heapq.merge(*entries))
+
+    async def wait(self, ticker_ids: Iterable[str], timeout: float) -> bool:
+        """Wait until any of the tickers gets a new frame. Returns False on timeout."""
+        waiter = asyncio.get_running_loop().create_future()
+        logs = [self._log(ticker_id) for ticker_id in ticker_ids]
+        for log in logs:
+            log.add_waiter(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for log in logs:
+                log.remove_waiter(waiter)
+
+    def drop(self, ticker_id: str) -> None:
+        """Discard the log of a removed ticker, waking its readers."""
+        log = self._logs.pop(ticker_id, None)
+        if log is not None:
+            log.notify()
+
+    def _log(self, ticker_id: str) -> BroadcastLog:
+        """Get the log of a ticker, creating it on first use."""
+        log = self._logs.get(ticker_id)
+        if log is None:
+            log = self._logs[ticker_id] = BroadcastLog(self.settings.sse_log_size)
+        return log
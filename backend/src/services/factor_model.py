@@ -0,0 +1,104 @@
+import math
+import random
+from array import array
+from itertools import repeat
+from operator import add, mul
+from typing import Dict, List, Optional
+
+
+class FactorModel:
+    """Correlated price shocks from a low-rank factor model.
+
+    Each ticker's shock is ``volatility * (b . f + sqrt(1 - share) * e)``,
+    where ``b`` are its factor loadings with ``|b|^2 = share``.
+    """
+
+    def __init__(
+        self,
+        factor_count: int,
+        systematic_share: float,
+        volatility: float,
+        seed: Optional[int] = None
+    ):
+        if factor_count <= 0:
+            raise ValueError("Factor count must be positive")
+        if not 0.0 <= systematic_share <= 1.0:
+            raise ValueError("Systematic share must be between 0 and 1")
+
+        self.factor_count = factor_count
+        self.systematic_share = systematic_share
+        self.volatility = volatility
+        self._random = random.Random(seed)
+        self._idiosyncratic = math.sqrt(1.0 - systematic_share)
+
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._loadings = [array("d") for _ in range(factor_count)]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, ticker_id: str) -> bool:
+        return ticker_id in self._slots
+
+    def add(self, ticker_id: str) -> None:
+        """Draw the loadings of a new ticker."""
+        if ticker_id in self._slots:
+            return
+
+        gauss = self._random.gauss
+        raw = [abs(gauss(0.0, 1.0))] + [gauss(0.0, 1.0) for _ in range(self.factor_count - 1)]
+        norm = math.sqrt(sum(value * value for value in raw)) or 1.0
+        scale = math.sqrt(self.systematic_share) / norm
+
+        self._slots[ticker_id] = len(self._ids)
+        self._ids.append(ticker_id)
+        for column, value in zip(self._loadings, raw):
+            column.append(value * scale)
+
+    def remove(self, ticker_id: str) -> None:
+        """Drop a ticker's loadings by moving the last slot into its place."""
+        slot = self._slots.pop(ticker_id, None)
+        if slot is None:
+            return
+
+        last = len(self._ids) - 1
+        if slot != last:
+            moved_id = self._ids[last]
+            self._slots[moved_id] = slot
+            self._ids[slot] = moved_id
+            for column in self._loadings:
+                column[slot] = column[last]
+
+        self._ids.pop()
+        for column in self._loadings:
+            column.pop()
+
+    def clear(self) -> None:
+        """Remove all tickers."""
+        self._slots.clear()
+        self._ids.clear()
+        self._loadings = [array("d") for _ in range(self.factor_count)]
+
+    def correlation(self, first_id: str, second_id: str) -> float:
+        """Get the model correlation between the shocks of two tickers."""
+        first = self._slots[first_id]
+        second = self._slots[second_id]
+        if first == second:
+            return 1.0
+        return sum(column[first] * column[second] for column in self._loadings)
+
+    def draw(self) -> Dict[str, float]:
+        """Draw one round of correlated shocks for all tickers."""
+        gauss = self._random.gauss
+        uniform = self._random.random
+        volatility = self.volatility
+        # Width of a centered uniform with the idiosyncratic standard deviation
+        width = 2.0 * math.sqrt(3.0) * volatility * self._idiosyncratic
+
+        shocks = [(uniform() - 0.5) * width for _ in range(len(self._ids))]
+        for column in self._loadings:
+            factor = gauss(0.0, volatility)
+            shocks = list(map(add, shocks, map(mul, column, repeat(factor))))
+
+        return dict(zip(self._ids, shocks))
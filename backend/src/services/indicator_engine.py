@@ -0,0 +1,193 @@
+import math
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from backend.src.domain.entities.price import Price
+from backend.src.core.config import get_settings
+
+
+class IndicatorEngine:
+    """Incremental streaming indicators updated in O(1) per tick.
+
+    State is kept column-wise: every ticker owns a slot index into flat
+    arrays, and the rolling window buffers are laid out as one ring of
+    ``window`` entries per slot.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._window = self.settings.indicator_window
+        self._alpha = 2.0 / (self.settings.indicator_ema_span + 1)
+
+        self._slots: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._ticks = array("q")
+        self._last = array("d")
+        self._ema = array("d")
+        self._return_sum = array("d")
+        self._return_sumsq = array("d")
+        self._pv_sum = array("d")
+        self._volume_sum = array("d")
+
+        # Rolling window rings, ``window`` entries per slot
+        self._returns = array("d")
+        self._prices = array("d")
+        self._volumes = array("d")
+
+        # Monotonic deques of (tick, price) for rolling min/max
+        self._mins: List[Deque[Tuple[int, float]]] = []
+        self._maxs: List[Deque[Tuple[int, float]]] = []
+
+    def update(self, prices: Iterable[Price]) -> None:
+        """Fold a batch of ticks into the indicators."""
+        window = self._window
+        alpha = self._alpha
+        slots = self._slots
+        ticks = self._ticks
+        last = self._last
+        ema = self._ema
+        return_sum = self._return_sum
+        return_sumsq = self._return_sumsq
+        pv_sum = self._pv_sum
+        volume_sum = self._volume_sum
+        returns = self._returns
+        ring_prices = self._prices
+        ring_volumes = self._volumes
+
+        for price in prices:
+            slot = slots.get(price.ticker_id)
+            if slot is None:
+                slot = self._allocate(price.ticker_id)
+
+            value = price.value
+            # Points without a volume carry no weight, so VWAP stays unset until volumes arrive
+            volume = price.volume if price.volume is not None else 0.0
+            tick = ticks[slot]
+            base = slot * window
+
+            if tick == 0:
+                ema[slot] = value
+            else:
+                ema[slot] += alpha * (value - ema[slot])
+
+                # Returns lag prices by one tick
+                log_return = math.log(value / last[slot])
+                position = base + (tick - 1) % window
+                if tick > window:
+                    evicted = returns[position]
+                    return_sum[slot] -= evicted
+                    return_sumsq[slot] -= evicted * evicted
+                returns[position] = log_return
+                return_sum[slot] += log_return
+                return_sumsq[slot] += log_return * log_return
+
+                if (tick - 1) % window == window - 1:
+                    # Re-anchor the running sums once per lap to stop float drift
+                    lap = returns[base:base + window]
+                    return_sum[slot] = sum(lap)
+                    return_sumsq[slot] = sum(r * r for r in lap)
+
+            position = base + tick % window
+            if tick >= window:
+                pv_sum[slot] -= ring_prices[position] * ring_volumes[position]
+                volume_sum[slot] -= ring_volumes[position]
+            ring_prices[position] = value
+            ring_volumes[position] = volume
+            pv_sum[slot] += value * volume
+            volume_sum[slot] += volume
+
+            expired = tick - window
+            mins = self._mins[slot]
+            while mins and mins[-1][1] >= value:
+                mins.pop()
+            mins.append((tick, value))
+            if mins[0][0] <= expired:
+                mins.popleft()
+
+            maxs = self._maxs[slot]
+            while maxs and maxs[-1][1] <= value:
+                maxs.pop()
+            maxs.append((tick, value))
+            if maxs[0][0] <= expired:
+                maxs.popleft()
+
+            last[slot] = value
+            ticks[slot] = tick + 1
+
+    def get_indicators(self, ticker_id: str) -> Optional[Dict[str, Optional[float]]]:
+        """Get the current indicator values for a ticker.
+
+        ``vwap`` is None while no point in the window carries a volume; the
+        simulated feed does not generate volumes.
+        """
+        slot = self._slots.get(ticker_id)
+        if slot is None:
+            return None
+
+        ticks = self._ticks[slot]
+        sample_count = min(ticks - 1, self._window)
+        volatility = None
+        if sample_count >= 2:
+            mean = self._return_sum[slot] / sample_count
+            variance = (self._return_sumsq[slot] - sample_count * mean * mean) / (sample_count - 1)
+            volatility = math.sqrt(max(variance, 0.0))
+
+        volume_sum = self._volume_sum[slot]
+        return {
+            "ema": self._ema[slot],
+            "volatility": volatility,
+            "min": self._mins[slot][0][1],
+            "max": self._maxs[slot][0][1],
+            "vwap": self._pv_sum[slot] / volume_sum if volume_sum > 0 else None,
+            "window": self._window,
+            "samples": min(ticks, self._window),
+        }
+
+    def remove(self, ticker_id: str) -> None:
+        """Drop a ticker's state by moving the last slot into its place."""
+        slot = self._slots.pop(ticker_id, None)
+        if slot is None:
+            return
+
+        last = len(self._slots)
+        if slot != last:
+            moved_id = self._ids[last]
+            self._slots[moved_id] = slot
+            self._ids[slot] = moved_id
+            for column in (self._ticks, self._last, self._ema, self._return_sum,
+                           self._return_sumsq, self._pv_sum, self._volume_sum):
+                column[slot] = column[last]
+            window = self._window
+            for ring in (self._returns, self._prices, self._volumes):
+                ring[slot * window:(slot + 1) * window] = ring[last * window:(last + 1) * window]
+            self._mins[slot] = self._mins[last]
+            self._maxs[slot] = self._maxs[last]
+
+        for column in (self._ticks, self._last, self._ema, self._return_sum,
+                       self._return_sumsq, self._pv_sum, self._volume_sum):
+            column.pop()
+        for ring in (self._returns, self._prices, self._volumes):
+            del ring[last * self._window:]
+        self._ids.pop()
+        self._mins.pop()
+        self._maxs.pop()
+
+    def _allocate(self, ticker_id: str) -> int:
+        """Allocate state for a new ticker and return its slot."""
+        slot = len(self._slots)
+        self._slots[ticker_id] = slot
+        self._ids.append(ticker_id)
+
+        self._ticks.append(0)
+        for column in (self._last, self._ema, self._return_sum, self._return_sumsq,
+                       self._pv_sum, self._volume_sum):
+            column.append(0.0)
+
+        empty_window = array("d", [0.0]) * self._window
+        self._returns.extend(empty_window)
+        self._prices.extend(empty_window)
+        self._volumes.extend(empty_window)
+
+        self._mins.append(deque())
+        self._maxs.append(deque())
+        return slot
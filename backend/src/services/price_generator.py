@@ -1,12 +1,16 @@
 import asyncio
+import math
 import random
 import logging
+from bisect import bisect_left, insort
 from datetime import datetime
 from typing import Dict, List, Optional
 from backend.src.domain.entities.ticker import Ticker
 from backend.src.domain.entities.price import Price
 from backend.src.domain.events.price_events import PriceUpdateEvent
 from backend.src.repositories.price_repository import PriceRepositoryProtocol
+from backend.src.services.indicator_engine import IndicatorEngine
+from backend.src.services.factor_model import FactorModel
 from backend.src.core.config import get_settings
 from backend.src.core.events import event_bus
 
@@ -16,16 +20,36 @@ logger = logging.getLogger(__name__)
 class PriceGenerator:
     """Service for generating random price updates."""
 
-    def __init__(self, price_repository: PriceRepositoryProtocol):
+    def __init__(
+        self,
+        price_repository: PriceRepositoryProtocol,
+        indicator_engine: Optional[IndicatorEngine] = None
+    ):
         self.settings = get_settings()
         self.price_repository = price_repository
+        self.indicator_engine = indicator_engine
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._tickers: Dict[str, Ticker] = {}
+        # Ticker ids in order, kept up to date for paginated listings
+        self._sorted_ids: List[str] = []
+        self.factor_model: Optional[FactorModel] = None
+        if self.settings.price_shock_model == "factor":
+            # Same per-step standard deviation as the uniform independent steps
+            self.factor_model = FactorModel(
+                self.settings.factor_count,
+                self.settings.factor_systematic_share,
+                self.settings.price_change_range / math.sqrt(3)
+            )
+        # Bumped whenever the set of tickers changes
+        self._universe_version = 0
+        self._tick_count = 0
 
     async def initialize_tickers(self) -> List[Ticker]:
         """Initialize tickers with random starting prices."""
         tickers = []
+        price_points = []
+        now = datetime.utcnow()
 
         for i in range(self.settings.ticker_count):
             ticker_id = f"ITEM_{i:02d}"
@@ -39,23 +63,39 @@ class PriceGenerator:
                 name=f"Item {i:02d}",
                 initial_price=initial_price,
                 current_price=initial_price,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             )
 
             self._tickers[ticker_id] = ticker
             tickers.append(ticker)
+            if self.factor_model is not None:
+                self.factor_model.add(ticker_id)
 
-            initial_price_point = Price(
+            price_points.append(Price(
                 ticker_id=ticker_id,
                 value=initial_price,
-                timestamp=datetime.utcnow()
-            )
-            await self.price_repository.add_price(initial_price_point)
+                timestamp=now
+            ))
+
+        await self.price_repository.add_prices(price_points)
+        self._sorted_ids = sorted(self._tickers)
+        self._universe_version += 1
 
         logger.info(f"Initialized {len(tickers)} tickers")
         return tickers
 
+    def load_tickers(self, tickers: List[Ticker]) -> None:
+        """Register previously persisted tickers, replacing any current ones."""
+        self._tickers = {ticker.id: ticker for ticker in tickers}
+        self._sorted_ids = sorted(self._tickers)
+        self._universe_version += 1
+        if self.factor_model is not None:
+            self.factor_model.clear()
+            for ticker_id in self._tickers:
+                self.factor_model.add(ticker_id)
+        logger.info(f"Loaded {len(self._tickers)} tickers")
+
     async def start(self) -> None:
         """Start generating price updates."""
         if self._running:
@@ -88,31 +128,126 @@ class PriceGenerator:
 
     async def _update_all_prices(self) -> None:
         """Update prices for all tickers."""
+        now = datetime.utcnow()
+        prices = []
+        batch_tickers = []
+
+        # No awaits inside this loop, so tickers added or removed at runtime
+        # can never change the dict while it is being iterated
+        changes = self.factor_model.draw() if self.factor_model is not None else None
+        change_range = self.settings.price_change_range
+
         for ticker_id, ticker in self._tickers.items():
-            change = random.uniform(
-                -self.settings.price_change_range,
-                self.settings.price_change_range
-            )
+            if changes is not None:
+                change = changes[ticker_id]
+            else:
+                change = random.uniform(-change_range, change_range)
 
             new_price = max(0.01, ticker.current_price + change)
 
-            ticker.update_price(new_price)
+            ticker.update_price(new_price, now)
 
-            price = Price(
+            batch_tickers.append(ticker)
+            prices.append(Price(
                 ticker_id=ticker_id,
                 value=new_price,
-                timestamp=datetime.utcnow()
-            )
+                timestamp=now
+            ))
+
+        self._tick_count += 1
+        version = self._universe_version
+        await self.price_repository.add_prices(prices)
+
+        # Tickers removed while the batch was stored must not be brought back by
+        # the indicator engine or the event bus; the repository clears them after
+        # this write because its lock is FIFO
+        tickers = self._tickers
+        if self._universe_version != version:
+            prices = [
+                price for price, ticker in zip(prices, batch_tickers)
+                if tickers.get(price.ticker_id) is ticker
+            ]
 
-            await self.price_repository.add_price(price)
+        if self.indicator_engine:
+            self.indicator_engine.update(prices)
 
+        for price in prices:
+            if price.ticker_id not in tickers:
+                # Removed while earlier events were being delivered
+                continue
             event = PriceUpdateEvent(
-                ticker_id=ticker_id,
-                price=new_price,
+                ticker_id=price.ticker_id,
+                price=price.value,
                 timestamp=price.timestamp
             )
             await event_bus.emit("price_update", event)
 
+    async def add_ticker(self, ticker_id: str, name: str, initial_price: Optional[float] = None) -> Ticker:
+        """Add a ticker at runtime; it is picked up by the next generation round."""
+        if ticker_id in self._tickers:
+            raise ValueError(f"Ticker {ticker_id} already exists")
+
+        if initial_price is None:
+            initial_price = random.uniform(
+                self.settings.initial_price_min,
+                self.settings.initial_price_max
+            )
+
+        now = datetime.utcnow()
+        ticker = Ticker(
+            id=ticker_id,
+            name=name,
+            initial_price=initial_price,
+            current_price=initial_price,
+            created_at=now,
+            updated_at=now
+        )
+
+        self._tickers[ticker_id] = ticker
+        insort(self._sorted_ids, ticker_id)
+        self._universe_version += 1
+        if self.factor_model is not None:
+            self.factor_model.add(ticker_id)
+        await self.price_repository.add_price(Price(
+            ticker_id=ticker_id,
+            value=initial_price,
+            timestamp=now
+        ))
+
+        logger.info(f"Added ticker {ticker_id}")
+        return ticker
+
+    async def remove_ticker(self, ticker_id: str) -> Ticker:
+        """Remove a ticker at runtime along with its history."""
+        ticker = self._tickers.pop(ticker_id, None)
+        if ticker is None:
+            raise ValueError(f"Ticker {ticker_id} not found")
+
+        del self._sorted_ids[bisect_left(self._sorted_ids, ticker_id)]
+        self._universe_version += 1
+        if self.factor_model is not None:
+            self.factor_model.remove(ticker_id)
+        if self.indicator_engine:
+            self.indicator_engine.remove(ticker_id)
+        await self.price_repository.clear_history(ticker_id)
+
+        logger.info(f"Removed ticker {ticker_id}")
+        return ticker
+
+    @property
+    def universe_version(self) -> int:
+        """Counter that changes whenever tickers are added or removed."""
+        return self._universe_version
+
+    @property
+    def tick_count(self) -> int:
+        """Number of completed generation rounds."""
+        return self._tick_count
+
+    def get_sorted_ticker_ids(self) -> List[str]:
+        """Get all ticker ids in order. The list is shared; do not modify it."""
+        return self._sorted_ids
+
     def get_tickers(self) -> List[Ticker]:
         """Get all tickers."""
         return list(self._tickers.values())
@@ -0,0 +1,294 @@
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from backend.src.domain.entities.ticker import Ticker
+from backend.src.repositories.price_repository import PriceRepositoryProtocol
+from backend.src.services.price_generator import PriceGenerator
+from backend.src.core.config import get_settings
+from backend.src.core.timeutils import to_epoch_seconds, from_epoch_seconds
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"RTPS"
+SNAPSHOT_VERSION = 1
+
+# magic, version, reserved, ticker count, ids size, names size, history points, saved at
+_HEADER = struct.Struct("<4sHHIIIQd")
+_SEPARATOR = "\n"
+
+# Timestamp and value arrays of each ticker, timestamps in epoch seconds
+History = Dict[str, Tuple[array, array]]
+
+
+def _to_bytes(values: array) -> bytes:
+    """Serialize an array in little-endian byte order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: memoryview) -> array:
+    """Deserialize a little-endian array."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def encode_snapshot(
+    tickers: List[Ticker],
+    history: History,
+    saved_at: float
+) -> bytes:
+    """Encode tickers and their price history into the binary snapshot layout.
+
+    Layout: header, newline separated ticker ids and names, then columnar
+    float64 arrays for ticker state, uint32 history counts per ticker and
+    float64 arrays of history timestamps and values.
+    """
+    ids = _SEPARATOR.join(ticker.id for ticker in tickers).encode("utf-8")
+    names = _SEPARATOR.join(ticker.name for ticker in tickers).encode("utf-8")
+
+    initial_prices = array("d", (ticker.initial_price for ticker in tickers))
+    current_prices = array("d", (ticker.current_price for ticker in tickers))
+    created_at = array("d", (to_epoch_seconds(ticker.created_at) for ticker in tickers))
+    updated_at = array("d", (to_epoch_seconds(ticker.updated_at) for ticker in tickers))
+
+    # History stays columnar; only whole arrays are copied, never single points
+    counts = array("I")
+    timestamps = []
+    values = []
+    empty = array("d")
+    for ticker in tickers:
+        point_timestamps, point_values = history.get(ticker.id, (empty, empty))
+        counts.append(len(point_values))
+        timestamps.append(_to_bytes(point_timestamps))
+        values.append(_to_bytes(point_values))
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        0,
+        len(tickers),
+        len(ids),
+        len(names),
+        sum(counts),
+        saved_at
+    )
+
+    return b"".join([
+        header,
+        ids,
+        names,
+        _to_bytes(initial_prices),
+        _to_bytes(current_prices),
+        _to_bytes(created_at),
+        _to_bytes(updated_at),
+        _to_bytes(counts),
+        *timestamps,
+        *values,
+    ])
+
+
+def decode_snapshot(data: memoryview) -> Tuple[List[Ticker], History]:
+    """Decode a binary snapshot into tickers and their columnar price history."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Snapshot is truncated")
+
+    magic, version, _, ticker_count, ids_size, names_size, point_count, _ = \
+        _HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Snapshot has an invalid magic number")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+
+    float_size = array("d").itemsize
+    count_size = array("I").itemsize
+    expected_size = (
+        _HEADER.size + ids_size + names_size
+        + 4 * ticker_count * float_size
+        + ticker_count * count_size
+        + 2 * point_count * float_size
+    )
+    if len(data) != expected_size:
+        raise ValueError("Snapshot size does not match its header")
+
+    offset = _HEADER.size
+
+    def take(size: int) -> memoryview:
+        nonlocal offset
+        chunk = data[offset:offset + size]
+        offset += size
+        return chunk
+
+    ids = bytes(take(ids_size)).decode("utf-8").split(_SEPARATOR) if ticker_count else []
+    names = bytes(take(names_size)).decode("utf-8").split(_SEPARATOR) if ticker_count else []
+    if len(ids) != ticker_count or len(names) != ticker_count:
+        raise ValueError("Snapshot ticker table is corrupt")
+
+    initial_prices = _from_bytes("d", take(ticker_count * float_size))
+    current_prices = _from_bytes("d", take(ticker_count * float_size))
+    created_at = _from_bytes("d", take(ticker_count * float_size))
+    updated_at = _from_bytes("d", take(ticker_count * float_size))
+    counts = _from_bytes("I", take(ticker_count * count_size))
+    timestamps = _from_bytes("d", take(point_count * float_size))
+    values = _from_bytes("d", take(point_count * float_size))
+
+    if sum(counts) != point_count:
+        raise ValueError("Snapshot history counts are corrupt")
+
+    # Ticks are stamped once per generation round, so most points share a
+    # handful of distinct timestamps; convert each of them only once.
+    datetimes: Dict[float, datetime] = {}
+
+    def to_datetime(seconds: float) -> datetime:
+        value = datetimes.get(seconds)
+        if value is None:
+            value = datetimes[seconds] = from_epoch_seconds(seconds)
+        return value
+
+    tickers = [
+        Ticker(
+            id=ids[i],
+            name=names[i],
+            initial_price=initial_prices[i],
+            current_price=current_prices[i],
+            created_at=to_datetime(created_at[i]),
+            updated_at=to_datetime(updated_at[i])
+        )
+        for i in range(ticker_count)
+    ]
+
+    history: History = {}
+    position = 0
+    for ticker_id, count in zip(ids, counts):
+        if count:
+            end = position + count
+            history[ticker_id] = (timestamps[position:end], values[position:end])
+            position = end
+
+    return tickers, history
+
+
+class SnapshotService:
+    """Service for persisting and restoring ticker state and price history."""
+
+    def __init__(self, price_generator: PriceGenerator, price_repository: PriceRepositoryProtocol):
+        self.settings = get_settings()
+        self.price_generator = price_generator
+        self.price_repository = price_repository
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a snapshot path is configured."""
+        return bool(self.settings.snapshot_path)
+
+    async def save(self) -> bool:
+        """Write an atomic snapshot of the current state."""
+        if not self.enabled:
+            return False
+
+        tickers = self.price_generator.get_tickers()
+        # Snapshots keep the recent window only; the compressed tier would
+        # otherwise decode its whole retention on every save
+        history = await self.price_repository.export_history(self.settings.max_history_size)
+        saved_at = time.time()
+
+        try:
+            await asyncio.to_thread(self._write, tickers, history, saved_at)
+        except OSError as e:
+            logger.error(f"Failed to write snapshot: {e}")
+            return False
+
+        logger.info(f"Saved snapshot of {len(tickers)} tickers")
+        return True
+
+    async def restore(self) -> bool:
+        """Restore tickers and history from the snapshot, if one exists."""
+        if not self.enabled or not os.path.exists(self.settings.snapshot_path):
+            return False
+
+        try:
+            tickers, history = await asyncio.to_thread(self._read)
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Ignoring unreadable snapshot: {e}")
+            return False
+
+        self.price_generator.load_tickers(tickers)
+        await self.price_repository.import_history(history)
+
+        point_count = sum(len(values) for _, values in history.values())
+        logger.info(f"Restored {len(tickers)} tickers and {point_count} prices from snapshot")
+        return True
+
+    async def start(self) -> None:
+        """Start writing snapshots periodically."""
+        if not self.enabled or self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._save_periodically())
+        logger.info("Snapshot service started")
+
+    async def stop(self) -> None:
+        """Stop periodic snapshots and write a final one."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        await self.save()
+        logger.info("Snapshot service stopped")
+
+    async def _save_periodically(self) -> None:
+        """Write snapshots continuously."""
+        while self._running:
+            await asyncio.sleep(self.settings.snapshot_interval)
+            try:
+                await self.save()
+            except Exception as e:
+                logger.error(f"Error saving snapshot: {e}")
+
+    def _write(self, tickers: List[Ticker], history: History, saved_at: float) -> None:
+        """Encode and atomically replace the snapshot file."""
+        path = self.settings.snapshot_path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        payload = encode_snapshot(tickers, history, saved_at)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _read(self) -> Tuple[List[Ticker], History]:
+        """Memory-map and decode the snapshot file."""
+        with open(self.settings.snapshot_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Snapshot is empty")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return decode_snapshot(view)
+                finally:
+                    view.release()
@@ -0,0 +1,79 @@
+from typing import Dict, FrozenSet, Generic, Hashable, Iterable, Set, Tuple, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+_EMPTY: FrozenSet = frozenset()
+
+
+class SubscriberRegistry(Generic[T]):
+    """Copy-on-write registry of subscribers per ticker with batched writes.
+
+    Each ticker maps to an immutable ``frozenset`` snapshot that readers use
+    without copying. Subscribes and unsubscribes are queued per ticker in O(1)
+    and folded into a new snapshot on the next read, so a reconnect storm on
+    a hot ticker costs one rebuild per broadcast rather than one per change.
+    Everything runs on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, FrozenSet[T]] = {}
+        # Pending (added, removed) subscribers per ticker; the two sets stay disjoint
+        self._pending: Dict[str, Tuple[Set[T], Set[T]]] = {}
+
+    def get(self, ticker_id: str) -> FrozenSet[T]:
+        """Get the current subscriber snapshot of a ticker."""
+        if ticker_id in self._pending:
+            self._publish(ticker_id)
+        return self._snapshots.get(ticker_id, _EMPTY)
+
+    def add(self, ticker_id: str, subscriber: T) -> None:
+        """Subscribe to a ticker."""
+        added, removed = self._changes(ticker_id)
+        removed.discard(subscriber)
+        added.add(subscriber)
+
+    def discard(self, ticker_id: str, subscriber: T) -> None:
+        """Unsubscribe from a ticker, if subscribed."""
+        self.discard_many(ticker_id, (subscriber,))
+
+    def discard_many(self, ticker_id: str, subscribers: Iterable[T]) -> None:
+        """Unsubscribe several subscribers from a ticker."""
+        if ticker_id not in self._snapshots and ticker_id not in self._pending:
+            return
+        added, removed = self._changes(ticker_id)
+        for subscriber in subscribers:
+            added.discard(subscriber)
+            removed.add(subscriber)
+
+    def pop(self, ticker_id: str) -> FrozenSet[T]:
+        """Remove a ticker and return its last subscriber snapshot."""
+        snapshot = self.get(ticker_id)
+        self._snapshots.pop(ticker_id, None)
+        return snapshot
+
+    def count(self, ticker_id: str) -> int:
+        """Get the number of subscribers of a ticker."""
+        return len(self.get(ticker_id))
+
+    def total(self) -> int:
+        """Get the number of subscriptions across all tickers."""
+        for ticker_id in list(self._pending):
+            self._publish(ticker_id)
+        return sum(len(subscribers) for subscribers in self._snapshots.values())
+
+    def _changes(self, ticker_id: str) -> Tuple[Set[T], Set[T]]:
+        """Get the pending change sets of a ticker, creating them if needed."""
+        changes = self._pending.get(ticker_id)
+        if changes is None:
+            changes = self._pending[ticker_id] = (set(), set())
+        return changes
+
+    def _publish(self, ticker_id: str) -> None:
+        """Fold the pending changes of a ticker into a new snapshot."""
+        added, removed = self._pending.pop(ticker_id)
+        current = self._snapshots.get(ticker_id, _EMPTY)
+        snapshot = current.difference(removed).union(added) if removed else current.union(added)
+        if snapshot:
+            self._snapshots[ticker_id] = snapshot
+        else:
+            self._snapshots.pop(ticker_id, None)
@@ -1,22 +1,124 @@
-from typing import List, Optional, Dict, Any
+import json
+import secrets
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 from backend.src.repositories.price_repository import PriceRepositoryProtocol
 from backend.src.services.price_generator import PriceGenerator
+from backend.src.services.indicator_engine import IndicatorEngine
 from backend.src.domain.entities.ticker import Ticker
 from backend.src.domain.entities.price import Price
 
 
+@dataclass(frozen=True)
+class TickerPage:
+    """Serialized page of the ticker listing."""
+    body: bytes
+    etag: str
+    next_cursor: Optional[str]
+
+
 class TickerService:
     """Service for managing tickers and their data."""
 
-    def __init__(self, price_generator: PriceGenerator, price_repository: PriceRepositoryProtocol):
+    # Distinct (cursor, limit, prefix) pages kept per listing version
+    PAGE_CACHE_SIZE = 256
+    DEFAULT_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        price_generator: PriceGenerator,
+        price_repository: PriceRepositoryProtocol,
+        indicator_engine: Optional[IndicatorEngine] = None
+    ):
         self.price_generator = price_generator
         self.price_repository = price_repository
+        self.indicator_engine = indicator_engine
+        # Distinguishes ETags issued by different processes with equal counters
+        self._boot_token = secrets.token_hex(4)
+        self._pages_etag = ""
+        self._pages: Dict[Tuple[Optional[str], int, Optional[str]], TickerPage] = {}
 
     def get_all_tickers(self) -> List[Dict[str, Any]]:
         """Get all available tickers."""
         tickers = self.price_generator.get_tickers()
         return [self._ticker_to_dict(ticker) for ticker in tickers]
 
+    def get_listing_etag(self) -> str:
+        """Get the ETag of the ticker listing; it changes with the universe and on every tick."""
+        return (
+            f'"{self._boot_token}-{self.price_generator.universe_version}'
+            f'-{self.price_generator.tick_count}"'
+        )
+
+    def get_tickers_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        prefix: Optional[str] = None
+    ) -> TickerPage:
+        """Get a serialized page of tickers ordered by id.
+
+        ``cursor`` is the last id of the previous page and ``prefix`` keeps only
+        ids starting with it; both are binary searches over the sorted ids.
+        Serialized pages are cached until the listing ETag changes, so
+        repeated requests between ticks are not rebuilt.
+        """
+        etag = self.get_listing_etag()
+        if etag != self._pages_etag:
+            self._pages.clear()
+            self._pages_etag = etag
+
+        key = (cursor, limit, prefix)
+        page = self._pages.get(key)
+        if page is not None:
+            return page
+
+        ids = self.price_generator.get_sorted_ticker_ids()
+        lo, hi = 0, len(ids)
+        if prefix:
+            lo = bisect_left(ids, prefix)
+            # Every id with the prefix sorts below the prefix followed by the highest code point
+            hi = bisect_left(ids, prefix + "\U0010ffff", lo)
+        if cursor is not None:
+            lo = max(lo, bisect_right(ids, cursor))
+
+        end = min(hi, lo + limit)
+        tickers = []
+        for ticker_id in ids[lo:end]:
+            ticker = self.price_generator.get_ticker(ticker_id)
+            if ticker:
+                tickers.append(self._ticker_to_dict(ticker))
+
+        page = TickerPage(
+            body=json.dumps(tickers, separators=(",", ":")).encode(),
+            etag=etag,
+            next_cursor=ids[end - 1] if end < hi else None
+        )
+        if len(self._pages) < self.PAGE_CACHE_SIZE:
+            self._pages[key] = page
+        return page
+
+    async def add_ticker(
+        self,
+        ticker_id: str,
+        name: Optional[str] = None,
+        initial_price: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Add a ticker at runtime."""
+        ticker = await self.price_generator.add_ticker(ticker_id, name or ticker_id, initial_price)
+        return self._ticker_to_dict(ticker)
+
+    async def remove_ticker(self, ticker_id: str) -> Dict[str, Any]:
+        """Remove a ticker at runtime."""
+        ticker = await self.price_generator.remove_ticker(ticker_id)
+        return self._ticker_to_dict(ticker)
+
+    def ticker_exists(self, ticker_id: str) -> bool:
+        """Check whether a ticker exists without touching its history."""
+        return self.price_generator.get_ticker(ticker_id) is not None
+
     async def get_ticker_history(self, ticker_id: str, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get ticker information with price history."""
         ticker = self.price_generator.get_ticker(ticker_id)
@@ -30,6 +132,60 @@ class TickerService:
             "history": [self._price_to_dict(price) for price in history]
         }
 
+    async def get_prices_as_of(
+        self,
+        at: datetime,
+        ticker_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get the latest price at or before ``at`` for some or all tickers."""
+        if ticker_ids is None:
+            ticker_ids = [ticker.id for ticker in self.price_generator.get_tickers()]
+        else:
+            for ticker_id in ticker_ids:
+                if not self.price_generator.get_ticker(ticker_id):
+                    raise ValueError(f"Ticker {ticker_id} not found")
+
+        prices = await self.price_repository.get_prices_as_of(at, ticker_ids)
+
+        return {
+            "as_of": at.isoformat(),
+            "prices": {
+                ticker_id: self._price_to_dict(price) if price else None
+                for ticker_id, price in prices.items()
+            }
+        }
+
+    async def get_ticker_stats(self, ticker_id: str, start: datetime, end: datetime) -> Dict[str, Any]:
+        """Get price statistics of a ticker over a time window."""
+        if not self.price_generator.get_ticker(ticker_id):
+            raise ValueError(f"Ticker {ticker_id} not found")
+
+        stats = await self.price_repository.get_window_stats(ticker_id, start, end)
+
+        return {
+            "ticker_id": ticker_id,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "stats": self._stats_to_dict(stats) if stats else None
+        }
+
+    def get_ticker_indicators(self, ticker_id: str) -> Dict[str, Any]:
+        """Get the streaming indicators of a ticker."""
+        ticker = self.price_generator.get_ticker(ticker_id)
+        if not ticker:
+            raise ValueError(f"Ticker {ticker_id} not found")
+
+        indicators = None
+        if self.indicator_engine:
+            indicators = self.indicator_engine.get_indicators(ticker_id)
+        if indicators is None:
+            raise ValueError(f"No indicators available for ticker {ticker_id}")
+
+        return {
+            "ticker_id": ticker_id,
+            "indicators": indicators
+        }
+
     def _ticker_to_dict(self, ticker: Ticker) -> Dict[str, Any]:
         """Convert ticker entity to dictionary."""
         return {
@@ -46,4 +202,18 @@ class TickerService:
         return {
             "value": round(price.value, 2),
             "timestamp": price.timestamp.isoformat()
+        }
+
+    def _stats_to_dict(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert window statistics to dictionary."""
+        return {
+            "count": stats["count"],
+            "first_timestamp": stats["first_timestamp"].isoformat(),
+            "last_timestamp": stats["last_timestamp"].isoformat(),
+            "open": round(stats["open"], 2),
+            "close": round(stats["close"], 2),
+            "high": round(stats["high"], 2),
+            "low": round(stats["low"], 2),
+            "mean": round(stats["mean"], 2),
+            "change": round(stats["change"], 2)
         }
\ No newline at end of file
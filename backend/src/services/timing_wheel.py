@@ -0,0 +1,58 @@
+import math
+from typing import Dict, Generic, Hashable, List, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class HashedTimingWheel(Generic[K]):
+    """Hashed timing wheel for scheduling many coarse-grained timers.
+
+    Timers are hashed into ``slot_count`` buckets by their deadline tick, so
+    scheduling and cancelling are O(1) and each ``advance`` only visits the
+    bucket of the current tick. Deadlines further away than one revolution
+    share a bucket with nearer ones and are skipped until their tick comes.
+    """
+
+    def __init__(self, slot_count: int, tick_duration: float):
+        if slot_count <= 0:
+            raise ValueError("Slot count must be positive")
+        if tick_duration <= 0:
+            raise ValueError("Tick duration must be positive")
+
+        self.tick_duration = tick_duration
+        self._slots: List[Dict[K, int]] = [{} for _ in range(slot_count)]
+        self._deadlines: Dict[K, int] = {}
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: K, delay: float) -> None:
+        """Schedule a timer for ``key`` after ``delay`` seconds, replacing any existing one."""
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay / self.tick_duration))
+        deadline = self._tick + ticks
+        self._slots[deadline % len(self._slots)][key] = deadline
+        self._deadlines[key] = deadline
+
+    def cancel(self, key: K) -> None:
+        """Cancel the timer for ``key``, if any."""
+        deadline = self._deadlines.pop(key, None)
+        if deadline is not None:
+            del self._slots[deadline % len(self._slots)][key]
+
+    def advance(self) -> List[K]:
+        """Move the wheel forward one tick and return the keys whose timers expired."""
+        self._tick += 1
+        slot = self._slots[self._tick % len(self._slots)]
+        if not slot:
+            return []
+
+        expired = [key for key, deadline in slot.items() if deadline <= self._tick]
+        for key in expired:
+            del slot[key]
+            del self._deadlines[key]
+        return expired
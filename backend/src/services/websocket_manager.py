@@ -1,10 +1,15 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Set, Optional
+import time
+from typing import Dict, List, Set, Optional
 from fastapi import WebSocket
+from backend.src.core.config import get_settings
 from backend.src.core.events import event_bus
 from backend.src.domain.events.price_events import PriceUpdateEvent
+from backend.src.services.timing_wheel import HashedTimingWheel
+from backend.src.services.subscriber_registry import SubscriberRegistry
+from backend.src.services.indicator_engine import IndicatorEngine
 
 logger = logging.getLogger(__name__)
 
@@ -12,29 +17,62 @@ logger = logging.getLogger(__name__)
 class WebSocketManager:
     """Manager for WebSocket connections and broadcasting."""
 
-    def __init__(self):
+    def __init__(self, indicator_engine: Optional[IndicatorEngine] = None):
+        self.settings = get_settings()
+        self.indicator_engine = indicator_engine
         # Store active connections by ticker_id
-        self._connections: Dict[str, Set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
+        self._connections: SubscriberRegistry[WebSocket] = SubscriberRegistry()
+        # Connections that opted in to indicators in price frames
+        self._indicator_connections: Set[WebSocket] = set()
 
-    async def connect(self, websocket: WebSocket, ticker_id: str) -> None:
+        # Heartbeat state: one shared timer wheel instead of a timer per connection
+        self._subscriptions: Dict[WebSocket, str] = {}
+        self._last_seen: Dict[WebSocket, float] = {}
+        self._heartbeats: HashedTimingWheel[WebSocket] = HashedTimingWheel(
+            self.settings.ws_timer_wheel_slots,
+            self.settings.ws_timer_tick
+        )
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._running = False
+        self._pings_sent = 0
+        self._reaped_connections = 0
+
+    async def start(self) -> None:
+        """Start sending heartbeats and reaping idle connections."""
+        if self._running:
+            return
+
+        self._running = True
+        self._heartbeat_task = asyncio.create_task(self._run_heartbeats())
+        logger.info("WebSocket heartbeats started")
+
+    async def stop(self) -> None:
+        """Stop sending heartbeats."""
+        self._running = False
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+        logger.info("WebSocket heartbeats stopped")
+
+    async def connect(self, websocket: WebSocket, ticker_id: str, with_indicators: bool = False) -> None:
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
 
-        async with self._lock:
-            if ticker_id not in self._connections:
-                self._connections[ticker_id] = set()
-            self._connections[ticker_id].add(websocket)
+        self._connections.add(ticker_id, websocket)
+        if with_indicators:
+            self._indicator_connections.add(websocket)
+        self._subscriptions[websocket] = ticker_id
+        self._last_seen[websocket] = time.monotonic()
+        self._heartbeats.schedule(websocket, self.settings.ws_heartbeat_interval)
 
         logger.info(f"Client connected to ticker {ticker_id}")
 
     async def disconnect(self, websocket: WebSocket, ticker_id: str) -> None:
         """Remove a WebSocket connection."""
-        async with self._lock:
-            if ticker_id in self._connections:
-                self._connections[ticker_id].discard(websocket)
-                if not self._connections[ticker_id]:
-                    del self._connections[ticker_id]
+        self._unregister(websocket, ticker_id)
 
         logger.info(f"Client disconnected from ticker {ticker_id}")
 
@@ -42,23 +80,37 @@ class WebSocketManager:
         """Broadcast price update to all connected clients for a ticker."""
         ticker_id = event.ticker_id
 
-        async with self._lock:
-            connections = self._connections.get(ticker_id, set()).copy()
+        # Immutable snapshot: no lock and no copy needed
+        connections = self._connections.get(ticker_id)
 
         if not connections:
             return
 
+        data = event.to_dict()
         message = json.dumps({
             "type": "price_update",
-            "data": event.to_dict()
+            "data": data
         })
 
+        # Indicators are only looked up when a subscriber of this ticker opted in
+        indicator_message = None
+        if self.indicator_engine and not self._indicator_connections.isdisjoint(connections):
+            indicators = self.indicator_engine.get_indicators(ticker_id)
+            if indicators is not None:
+                indicator_message = json.dumps({
+                    "type": "price_update",
+                    "data": {**data, "indicators": indicators}
+                })
+
         # Send to all connections concurrently
         disconnected = []
 
         async def send_to_client(ws: WebSocket) -> None:
             try:
-                await ws.send_text(message)
+                if indicator_message and ws in self._indicator_connections:
+                    await ws.send_text(indicator_message)
+                else:
+                    await ws.send_text(message)
             except Exception:
                 disconnected.append(ws)
 
@@ -69,9 +121,29 @@ class WebSocketManager:
 
         # Clean up disconnected clients
         if disconnected:
-            async with self._lock:
-                for ws in disconnected:
-                    self._connections[ticker_id].discard(ws)
+            self._connections.discard_many(ticker_id, disconnected)
+            for ws in disconnected:
+                self._forget(ws)
+
+    async def drop_ticker(self, ticker_id: str) -> int:
+        """Close every connection subscribed to a removed ticker."""
+        websockets = self._connections.pop(ticker_id)
+        for ws in websockets:
+            self._forget(ws)
+
+        async def close(ws: WebSocket) -> None:
+            try:
+                await ws.close(code=4004, reason="Ticker removed")
+            except Exception:
+                pass
+
+        await asyncio.gather(*[close(ws) for ws in websockets], return_exceptions=True)
+        return len(websockets)
+
+    def touch(self, websocket: WebSocket) -> None:
+        """Record activity from a client, postponing its heartbeat."""
+        if websocket in self._last_seen:
+            self._last_seen[websocket] = time.monotonic()
 
     async def send_error(self, websocket: WebSocket, error: str) -> None:
         """Send error message to a specific client."""
@@ -86,8 +158,99 @@ class WebSocketManager:
     def get_connection_count(self, ticker_id: Optional[str] = None) -> int:
         """Get number of active connections."""
         if ticker_id:
-            return len(self._connections.get(ticker_id, set()))
-        return sum(len(conns) for conns in self._connections.values())
+            return self._connections.count(ticker_id)
+        return self._connections.total()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection and heartbeat counters."""
+        return {
+            "connections": self.get_connection_count(),
+            "pings_sent": self._pings_sent,
+            "reaped_connections": self._reaped_connections
+        }
+
+    def _unregister(self, websocket: WebSocket, ticker_id: str) -> None:
+        """Drop a connection from the registry and all per-connection state."""
+        self._connections.discard(ticker_id, websocket)
+        self._forget(websocket)
+
+    def _forget(self, websocket: WebSocket) -> None:
+        """Drop per-connection state other than the subscription itself."""
+        self._indicator_connections.discard(websocket)
+        self._subscriptions.pop(websocket, None)
+        self._last_seen.pop(websocket, None)
+        self._heartbeats.cancel(websocket)
+
+    async def _run_heartbeats(self) -> None:
+        """Advance the heartbeat wheel continuously."""
+        while self._running:
+            await asyncio.sleep(self._heartbeats.tick_duration)
+            try:
+                await self._process_heartbeats(self._heartbeats.advance())
+            except Exception as e:
+                logger.error(f"Error processing heartbeats: {e}")
+
+    async def _process_heartbeats(self, expired: List[WebSocket]) -> None:
+        """Ping connections that went quiet and reap those past the idle timeout."""
+        if not expired:
+            return
+
+        interval = self.settings.ws_heartbeat_interval
+        timeout = self.settings.ws_idle_timeout
+        now = time.monotonic()
+        to_ping = []
+        to_reap = []
+
+        for ws in expired:
+            last_seen = self._last_seen.get(ws)
+            if last_seen is None:
+                continue
+
+            idle = now - last_seen
+            if idle >= timeout:
+                to_reap.append(ws)
+            elif idle >= interval:
+                to_ping.append(ws)
+                self._heartbeats.schedule(ws, min(interval, timeout - idle))
+            else:
+                self._heartbeats.schedule(ws, interval - idle)
+
+        if to_ping:
+            message = json.dumps({"type": "ping"})
+
+            async def ping(ws: WebSocket) -> None:
+                try:
+                    await ws.send_text(message)
+                except Exception:
+                    to_reap.append(ws)
+
+            await asyncio.gather(*[ping(ws) for ws in to_ping], return_exceptions=True)
+            self._pings_sent += len(to_ping)
+
+        if to_reap:
+            await self._reap(to_reap)
+
+    async def _reap(self, websockets: List[WebSocket]) -> None:
+        """Evict unresponsive connections in bulk."""
+        by_ticker: Dict[str, List[WebSocket]] = {}
+        for ws in websockets:
+            ticker_id = self._subscriptions.get(ws)
+            if ticker_id is not None:
+                by_ticker.setdefault(ticker_id, []).append(ws)
+        for ticker_id, evicted in by_ticker.items():
+            self._connections.discard_many(ticker_id, evicted)
+            for ws in evicted:
+                self._forget(ws)
+
+        async def close(ws: WebSocket) -> None:
+            try:
+                await ws.close(code=1001, reason="Heartbeat timeout")
+            except Exception:
+                pass
+
+        await asyncio.gather(*[close(ws) for ws in websockets], return_exceptions=True)
+        self._reaped_connections += len(websockets)
+        logger.info(f"Reaped {len(websockets)} unresponsive connections")
 
 
 websocket_manager = WebSocketManager()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import patch
+from backend.src.services.admission_controller import AdmissionController, TokenBucket
+from backend.src.core.config import Settings
+
+
+@pytest.fixture
+def mock_settings():
+    return Settings(
+        ws_max_connections=3,
+        ws_max_connections_per_ip=2,
+        ws_accept_rate=1.0,
+        ws_accept_burst=10,
+        loop_lag_threshold=0.5
+    )
+
+
+@pytest.fixture
+def admission_controller(mock_settings):
+    with patch('backend.src.services.admission_controller.get_settings', return_value=mock_settings):
+        return AdmissionController()
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        with patch('backend.src.services.admission_controller.time.monotonic') as monotonic:
+            monotonic.return_value = 0.0
+            bucket = TokenBucket(rate=2.0, burst=2)
+
+            assert bucket.try_acquire() is True
+            assert bucket.try_acquire() is True
+            assert bucket.try_acquire() is False
+
+            monotonic.return_value = 0.5
+            assert bucket.try_acquire() is True
+            assert bucket.try_acquire() is False
+
+
+class TestAdmissionController:
+    def test_per_ip_cap(self, admission_controller):
+        assert admission_controller.admit("10.0.0.1") is None
+        assert admission_controller.admit("10.0.0.1") is None
+        assert admission_controller.admit("10.0.0.1") == AdmissionController.REJECT_PER_IP
+
+        admission_controller.release("10.0.0.1")
+        assert admission_controller.admit("10.0.0.1") is None
+
+    def test_global_cap(self, admission_controller):
+        for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            assert admission_controller.admit(ip) is None
+
+        assert admission_controller.admit("10.0.0.4") == AdmissionController.REJECT_CAPACITY
+        assert admission_controller.get_stats()["rejections"] == {AdmissionController.REJECT_CAPACITY: 1}
+
+    def test_rate_limit(self, admission_controller, mock_settings):
+        mock_settings.ws_max_connections = 100
+        mock_settings.ws_max_connections_per_ip = 100
+
+        results = [admission_controller.admit("10.0.0.1") for _ in range(11)]
+
+        assert results[:10] == [None] * 10
+        assert results[10] == AdmissionController.REJECT_RATE
+
+    def test_sheds_when_loop_lags(self, admission_controller):
+        admission_controller._loop_lag = 0.75
+
+        assert admission_controller.overloaded is True
+        assert admission_controller.admit("10.0.0.1") == AdmissionController.REJECT_OVERLOADED
+        assert admission_controller.get_stats()["connections"] == 0
+
+    def test_release_unknown_ip_is_noop(self, admission_controller):
+        admission_controller.release("10.0.0.1")
+
+        assert admission_controller.get_stats()["connections"] == 0
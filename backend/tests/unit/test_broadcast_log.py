@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from backend.src.services.broadcast_log import BroadcastHub, BroadcastLog
+from backend.src.domain.events.price_events import PriceUpdateEvent
+from backend.src.core.config import Settings
+
+
+@pytest.fixture
+def broadcast_hub():
+    with patch('backend.src.services.broadcast_log.get_settings', return_value=Settings(sse_log_size=3)):
+        return BroadcastHub()
+
+
+def publish(hub: BroadcastHub, ticker_id: str, price: float) -> None:
+    hub.publish(PriceUpdateEvent(ticker_id=ticker_id, price=price, timestamp=datetime.utcnow()))
+
+
+class TestBroadcastLog:
+    def test_capacity_keeps_latest_frames(self):
+        log = BroadcastLog(capacity=3)
+        for sequence in range(1, 11):
+            log.append(sequence, f"{sequence}".encode())
+
+        assert len(log) == 3
+        assert [sequence for sequence, _ in log.read_after(0)] == [8, 9, 10]
+        assert log.read_after(9) == [(10, b"10")]
+        assert log.read_after(10) == []
+        assert log.trimmed_through == 7
+
+
+class TestBroadcastHub:
+    def test_frames_are_server_sent_events(self, broadcast_hub):
+        publish(broadcast_hub, "ITEM_00", 101.5)
+
+        [(sequence, frame)] = broadcast_hub.read(["ITEM_00"], 0)
+
+        assert sequence == 1
+        assert frame.startswith(f"id: {broadcast_hub.boot_token}-1\nevent: price_update\ndata: {{".encode())
+        assert b'"price": 101.5' in frame
+        assert frame.endswith(b"\n\n")
+
+    def test_multi_ticker_read_is_ordered_and_resumable(self, broadcast_hub):
+        publish(broadcast_hub, "ITEM_00", 1.0)
+        publish(broadcast_hub, "ITEM_01", 2.0)
+        publish(broadcast_hub, "ITEM_02", 3.0)
+        publish(broadcast_hub, "ITEM_00", 4.0)
+
+        entries = broadcast_hub.read(["ITEM_01", "ITEM_00"], 0)
+        assert [sequence for sequence, _ in entries] == [1, 2, 4]
+
+        resumed = broadcast_hub.read(["ITEM_01", "ITEM_00"], 2)
+        assert [sequence for sequence, _ in resumed] == [4]
+
+    def test_frames_are_shared_between_readers(self, broadcast_hub):
+        publish(broadcast_hub, "ITEM_00", 1.0)
+
+        first = broadcast_hub.read(["ITEM_00"], 0)[0][1]
+        second = broadcast_hub.read(["ITEM_00"], 0)[0][1]
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_publish(self, broadcast_hub):
+        waiting = asyncio.create_task(broadcast_hub.wait(["ITEM_00", "ITEM_01"], timeout=1.0))
+        await asyncio.sleep(0)
+        publish(broadcast_hub, "ITEM_01", 1.0)
+
+        assert await waiting is True
+        assert await broadcast_hub.wait(["ITEM_00"], timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_drop_wakes_readers(self, broadcast_hub):
+        publish(broadcast_hub, "ITEM_00", 1.0)
+        waiting = asyncio.create_task(broadcast_hub.wait(["ITEM_00"], timeout=1.0))
+        await asyncio.sleep(0)
+        broadcast_hub.drop("ITEM_00")
+
+        assert await waiting is True
+        assert broadcast_hub.read(["ITEM_00"], 0) == []
+
+    def test_event_ids_from_other_processes_are_not_resumed(self, broadcast_hub):
+        """Test that event ids only resume within the process that issued them."""
+        assert broadcast_hub.parse_event_id(f"{broadcast_hub.boot_token}-12") == 12
+        assert broadcast_hub.parse_event_id("0badf00d-12") is None
+        with pytest.raises(ValueError):
+            broadcast_hub.parse_event_id("12")
+
+    def test_trimmed_cursor_cannot_resume(self, broadcast_hub):
+        """Test that cursors behind the retained log or ahead of the sequence are refused."""
+        for price in range(5):
+            publish(broadcast_hub, "ITEM_00", float(price))
+        publish(broadcast_hub, "ITEM_01", 1.0)
+
+        assert broadcast_hub.can_resume(["ITEM_00", "ITEM_01"], 2)
+        assert not broadcast_hub.can_resume(["ITEM_00"], 1)
+        assert broadcast_hub.can_resume(["ITEM_01"], 0)
+        assert not broadcast_hub.can_resume(["ITEM_00"], 7)
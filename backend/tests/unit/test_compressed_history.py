@@ -0,0 +1,170 @@
+import math
+import random
+import pytest
+from array import array
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from backend.src.repositories.compressed_history import (
+    CompressedPriceRepository,
+    CompressedSeries,
+    decode_block,
+    encode_block
+)
+from backend.src.domain.entities.price import Price
+from backend.src.core.config import Settings
+from backend.src.core.timeutils import from_epoch_seconds
+
+
+T0 = datetime(2024, 1, 15, 10, 30)
+
+
+@pytest.fixture
+def compressed_repository():
+    settings = Settings(compressed_block_size=4, compressed_history_size=10)
+    with patch('backend.src.repositories.compressed_history.get_settings', return_value=settings):
+        return CompressedPriceRepository()
+
+
+def random_walk(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    timestamps = array("q")
+    values = array("d")
+    timestamp = 1_700_000_000_000_000
+    value = 100.0
+    for _ in range(count):
+        timestamp += 1_000_000 + rng.randint(-2_000, 2_000)
+        value = max(0.01, value + rng.uniform(-1.0, 1.0))
+        timestamps.append(timestamp)
+        values.append(value)
+    return timestamps, values
+
+
+class TestBlockCodec:
+    def test_round_trip_random_walk(self):
+        timestamps, values = random_walk(500)
+
+        data = encode_block(timestamps, values)
+
+        assert decode_block(data, len(values)) == (timestamps, values)
+        assert len(data) < 16 * len(values)
+
+    @pytest.mark.parametrize("timestamps,values", [
+        ([5], [1.5]),
+        ([0, 0, 0], [2.0, 2.0, 2.0]),
+        ([-10, 10**15, 3, 2**62], [math.pi, -0.0, 1e300, 5e-324]),
+        ([1, 2, 4, 8, 16, 1000, 1001], [1.0, 1.0000000001, 1.0, 65.25, 65.25, 1e-9, 0.01]),
+    ])
+    def test_round_trip_edge_cases(self, timestamps, values):
+        timestamps = array("q", timestamps)
+        values = array("d", values)
+
+        assert decode_block(encode_block(timestamps, values), len(values)) == (timestamps, values)
+
+
+class TestCompressedSeries:
+    def test_retention_and_limits(self):
+        series = CompressedSeries(block_size=4, capacity=10)
+        timestamps, values = random_walk(23)
+        for timestamp, value in zip(timestamps, values):
+            series.append(timestamp, value)
+
+        assert len(series) == 10
+        assert series.points() == (timestamps[-10:], values[-10:])
+        assert series.points(3) == (timestamps[-3:], values[-3:])
+        assert series.latest() == (timestamps[-1], values[-1])
+
+    def test_extend_matches_append(self):
+        timestamps, values = random_walk(23)
+        appended = CompressedSeries(block_size=4, capacity=10)
+        for timestamp, value in zip(timestamps, values):
+            appended.append(timestamp, value)
+
+        extended = CompressedSeries(block_size=4, capacity=10)
+        extended.append(timestamps[0], values[0])
+        extended.extend(timestamps[1:], values[1:])
+
+        assert len(extended) == len(appended)
+        assert extended.points() == appended.points()
+        assert extended.latest() == appended.latest()
+        assert extended.compressed_bytes == appended.compressed_bytes
+
+    def test_as_of_and_window_respect_retention(self):
+        series = CompressedSeries(block_size=4, capacity=10)
+        timestamps, values = random_walk(23)
+        for timestamp, value in zip(timestamps, values):
+            series.append(timestamp, value)
+
+        assert series.as_of(timestamps[12]) is None
+        assert series.as_of(timestamps[13]) == (timestamps[13], values[13])
+        assert series.as_of(timestamps[15] + 1) == (timestamps[15], values[15])
+        assert series.window(timestamps[0], timestamps[-1]) == (timestamps[-10:], values[-10:])
+        assert series.window(timestamps[14], timestamps[20]) == (timestamps[14:21], values[14:21])
+
+    def test_window_keeps_duplicates_across_blocks(self):
+        """Test that equal timestamps split across a block boundary are all returned."""
+        series = CompressedSeries(block_size=5, capacity=20)
+        for timestamp, value in ((7, 7.0), (8, 8.0), (9, 9.0), (10, 10.0), (11, 10.0), (11, 11.0), (11, 12.0)):
+            series.append(timestamp, value)
+
+        assert series.window(11, 11) == (array("q", [11, 11, 11]), array("d", [10.0, 11.0, 12.0]))
+        for _ in range(5):
+            series.append(11, 13.0)
+        assert len(series.window(11, 12)[0]) == 8
+
+    def test_capacity_must_cover_a_block(self):
+        with pytest.raises(ValueError):
+            CompressedSeries(block_size=4, capacity=3)
+
+    def test_out_of_order_points_stay_sorted(self):
+        """Test that a backwards clock step never breaks the timestamp order."""
+        series = CompressedSeries(block_size=4, capacity=10)
+        for timestamp, value in ((10, 1.0), (20, 2.0), (30, 3.0), (40, 4.0), (50, 5.0), (70, 7.0), (60, 6.0), (5, 0.5)):
+            series.append(timestamp, value)
+
+        timestamps, values = series.points()
+        assert list(timestamps) == [10, 20, 30, 40, 50, 50, 60, 70]
+        assert list(values) == [1.0, 2.0, 3.0, 4.0, 5.0, 0.5, 6.0, 7.0]
+        assert series.as_of(65) == (60, 6.0)
+        assert series.window(55, 65) == (array("q", [60]), array("d", [6.0]))
+
+
+class TestCompressedPriceRepository:
+    @pytest.mark.asyncio
+    async def test_history_round_trip(self, compressed_repository):
+        prices = [
+            Price(ticker_id="ITEM_00", value=100.0 + i / 3, timestamp=T0 + timedelta(seconds=i, microseconds=i))
+            for i in range(7)
+        ]
+        await compressed_repository.add_prices(prices)
+
+        assert await compressed_repository.get_history("ITEM_00") == prices
+        assert await compressed_repository.get_history("ITEM_00", limit=2) == prices[-2:]
+        assert await compressed_repository.get_latest_price("ITEM_00") == prices[-1]
+        timestamps, values = (await compressed_repository.export_history())["ITEM_00"]
+        assert list(values) == [p.value for p in prices]
+        assert [from_epoch_seconds(t) for t in timestamps] == [p.timestamp for p in prices]
+        timestamps, values = (await compressed_repository.export_history(limit=3))["ITEM_00"]
+        assert list(values) == [p.value for p in prices[-3:]]
+
+    @pytest.mark.asyncio
+    async def test_as_of_and_stats(self, compressed_repository):
+        for i in range(9):
+            await compressed_repository.add_price(
+                Price(ticker_id="ITEM_00", value=10.0 + i, timestamp=T0 + timedelta(seconds=i))
+            )
+
+        prices = await compressed_repository.get_prices_as_of(T0 + timedelta(seconds=2, milliseconds=1))
+        stats = await compressed_repository.get_window_stats(
+            "ITEM_00", T0 + timedelta(seconds=3), T0 + timedelta(seconds=6)
+        )
+
+        assert prices["ITEM_00"].value == 12.0
+        assert (stats["count"], stats["open"], stats["close"]) == (4, 13.0, 16.0)
+
+    @pytest.mark.asyncio
+    async def test_clear_history(self, compressed_repository):
+        await compressed_repository.add_price(Price(ticker_id="ITEM_00", value=1.0, timestamp=T0))
+        await compressed_repository.clear_history("ITEM_00")
+
+        assert await compressed_repository.get_history("ITEM_00") == []
+        assert await compressed_repository.get_latest_price("ITEM_00") is None
@@ -0,0 +1,25 @@
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from backend.src.api.dependencies import require_admin
+from backend.src.core.config import Settings
+
+
+class TestRequireAdmin:
+    @pytest.mark.asyncio
+    async def test_disabled_without_token(self):
+        """Test that the admin API is unavailable unless a token is configured."""
+        with patch('backend.src.api.dependencies.get_settings', return_value=Settings(admin_token="")):
+            with pytest.raises(HTTPException) as error:
+                await require_admin("")
+        assert error.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_checks_configured_token(self):
+        """Test that only the configured token is accepted."""
+        with patch('backend.src.api.dependencies.get_settings', return_value=Settings(admin_token="secret")):
+            await require_admin("secret")
+            for token in (None, "", "wrong"):
+                with pytest.raises(HTTPException) as error:
+                    await require_admin(token)
+                assert error.value.status_code == 401
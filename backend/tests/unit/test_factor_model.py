@@ -0,0 +1,70 @@
+import math
+import statistics
+import pytest
+from backend.src.services.factor_model import FactorModel
+
+
+def sample(model: FactorModel, rounds: int):
+    draws = [model.draw() for _ in range(rounds)]
+    return {ticker_id: [draw[ticker_id] for draw in draws] for ticker_id in draws[0]}
+
+
+class TestFactorModel:
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            FactorModel(0, 0.5, 1.0)
+        with pytest.raises(ValueError):
+            FactorModel(2, 1.5, 1.0)
+
+    def test_loadings_match_systematic_share(self):
+        model = FactorModel(4, 0.6, 1.0, seed=1)
+        for i in range(10):
+            model.add(f"ITEM_{i:02d}")
+
+        for i in range(10):
+            loadings = [column[i] for column in model._loadings]
+            assert sum(value * value for value in loadings) == pytest.approx(0.6)
+            assert loadings[0] >= 0.0
+
+    def test_single_factor_correlation(self):
+        """Test that a market-only model correlates every pair by the systematic share."""
+        model = FactorModel(1, 0.5, 2.0, seed=7)
+        model.add("ITEM_00")
+        model.add("ITEM_01")
+        assert model.correlation("ITEM_00", "ITEM_01") == pytest.approx(0.5)
+
+        shocks = sample(model, 5_000)
+        assert statistics.correlation(shocks["ITEM_00"], shocks["ITEM_01"]) == pytest.approx(0.5, abs=0.05)
+        assert statistics.stdev(shocks["ITEM_00"]) == pytest.approx(2.0, rel=0.05)
+
+    def test_empirical_correlation_matches_model(self):
+        model = FactorModel(3, 0.8, 1.0, seed=3)
+        for ticker_id in ("A", "B", "C"):
+            model.add(ticker_id)
+
+        shocks = sample(model, 5_000)
+        for first, second in (("A", "B"), ("A", "C"), ("B", "C")):
+            expected = model.correlation(first, second)
+            assert statistics.correlation(shocks[first], shocks[second]) == pytest.approx(expected, abs=0.05)
+
+    def test_remove_keeps_moved_loadings(self):
+        model = FactorModel(2, 0.5, 1.0, seed=5)
+        for ticker_id in ("A", "B", "C"):
+            model.add(ticker_id)
+        expected = model.correlation("B", "C")
+
+        model.remove("A")
+        model.remove("MISSING")
+
+        assert "A" not in model
+        assert len(model) == 2
+        assert model.correlation("B", "C") == pytest.approx(expected)
+        assert set(model.draw()) == {"B", "C"}
+
+    def test_zero_share_is_independent(self):
+        model = FactorModel(2, 0.0, 1.0, seed=9)
+        model.add("A")
+        model.add("B")
+
+        assert model.correlation("A", "B") == 0.0
+        assert all(math.isfinite(value) for value in model.draw().values())
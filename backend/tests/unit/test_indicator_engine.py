@@ -0,0 +1,116 @@
+import math
+import random
+import statistics
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from backend.src.services.indicator_engine import IndicatorEngine
+from backend.src.domain.entities.price import Price
+from backend.src.core.config import Settings
+
+
+WINDOW = 5
+
+
+@pytest.fixture
+def mock_settings():
+    return Settings(indicator_window=WINDOW, indicator_ema_span=9)
+
+
+@pytest.fixture
+def indicator_engine(mock_settings):
+    with patch('backend.src.services.indicator_engine.get_settings', return_value=mock_settings):
+        return IndicatorEngine()
+
+
+def make_prices(ticker_id: str, values, volumes=None):
+    volumes = volumes or [None] * len(values)
+    now = datetime.utcnow()
+    return [
+        Price(ticker_id=ticker_id, value=value, timestamp=now, volume=volume)
+        for value, volume in zip(values, volumes)
+    ]
+
+
+class TestIndicatorEngine:
+    def test_unknown_ticker(self, indicator_engine):
+        """Test that tickers without ticks have no indicators."""
+        assert indicator_engine.get_indicators("ITEM_00") is None
+
+    def test_first_tick(self, indicator_engine):
+        """Test indicators after a single tick."""
+        indicator_engine.update(make_prices("ITEM_00", [100.0]))
+
+        indicators = indicator_engine.get_indicators("ITEM_00")
+        assert indicators["ema"] == 100.0
+        assert indicators["min"] == indicators["max"] == 100.0
+        assert indicators["vwap"] is None
+        assert indicators["volatility"] is None
+        assert indicators["samples"] == 1
+
+    def test_matches_full_recomputation(self, indicator_engine):
+        """Test incremental values against a brute-force recomputation over history."""
+        rng = random.Random(42)
+        values = [100.0]
+        for _ in range(60):
+            values.append(max(0.01, values[-1] + rng.uniform(-1.0, 1.0)))
+        volumes = [rng.uniform(1.0, 10.0) for _ in values]
+
+        alpha = 2.0 / (9 + 1)
+        ema = values[0]
+        for i, (value, volume) in enumerate(zip(values, volumes)):
+            indicator_engine.update(make_prices("ITEM_00", [value], [volume]))
+            if i:
+                ema += alpha * (value - ema)
+
+            window_values = values[max(0, i - WINDOW + 1):i + 1]
+            window_volumes = volumes[max(0, i - WINDOW + 1):i + 1]
+            returns = [
+                math.log(values[j] / values[j - 1])
+                for j in range(max(1, i - WINDOW + 1), i + 1)
+            ]
+
+            indicators = indicator_engine.get_indicators("ITEM_00")
+            assert indicators["ema"] == pytest.approx(ema)
+            assert indicators["min"] == min(window_values)
+            assert indicators["max"] == max(window_values)
+            assert indicators["vwap"] == pytest.approx(
+                sum(v * w for v, w in zip(window_values, window_volumes)) / sum(window_volumes)
+            )
+            if len(returns) >= 2:
+                assert indicators["volatility"] == pytest.approx(statistics.stdev(returns), abs=1e-12)
+
+    def test_tickers_are_independent(self, indicator_engine):
+        """Test that a batch spanning several tickers keeps their state apart."""
+        now = datetime.utcnow()
+        indicator_engine.update([
+            Price(ticker_id="ITEM_00", value=10.0, timestamp=now),
+            Price(ticker_id="ITEM_01", value=20.0, timestamp=now),
+            Price(ticker_id="ITEM_00", value=12.0, timestamp=now),
+        ])
+
+        assert indicator_engine.get_indicators("ITEM_00")["max"] == 12.0
+        assert indicator_engine.get_indicators("ITEM_01")["max"] == 20.0
+        assert indicator_engine.get_indicators("ITEM_01")["samples"] == 1
+
+    def test_remove_keeps_other_tickers(self, indicator_engine):
+        """Test that removing a ticker leaves the moved slot's state intact."""
+        for ticker_id, values in (("ITEM_00", [1.0, 2.0]), ("ITEM_01", [5.0, 7.0]), ("ITEM_02", [9.0, 3.0])):
+            indicator_engine.update(make_prices(ticker_id, values))
+        expected = indicator_engine.get_indicators("ITEM_02")
+
+        indicator_engine.remove("ITEM_00")
+        indicator_engine.remove("MISSING")
+
+        assert indicator_engine.get_indicators("ITEM_00") is None
+        assert indicator_engine.get_indicators("ITEM_02") == expected
+        assert indicator_engine.get_indicators("ITEM_01")["max"] == 7.0
+
+        indicator_engine.update(make_prices("ITEM_00", [4.0]))
+        assert indicator_engine.get_indicators("ITEM_00")["samples"] == 1
+
+    def test_vwap_ignores_points_without_volume(self, indicator_engine):
+        """Test that VWAP only weighs points that carry a volume."""
+        indicator_engine.update(make_prices("ITEM_00", [10.0, 20.0, 30.0], [None, 1.0, 3.0]))
+
+        assert indicator_engine.get_indicators("ITEM_00")["vwap"] == pytest.approx(27.5)
@@ -1,9 +1,12 @@
+import asyncio
 import pytest
 from unittest.mock import MagicMock, patch
 from backend.src.services.price_generator import PriceGenerator
 from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
 from backend.src.domain.entities.ticker import Ticker
+from backend.src.services.indicator_engine import IndicatorEngine
 from backend.src.core.config import Settings
+from backend.src.core.events import event_bus
 
 
 @pytest.fixture
@@ -99,4 +102,81 @@ class TestPriceGenerator:
 
         for ticker in updated_tickers:
             history = await price_repository.get_history(ticker.id)
-            assert len(history) >= 2
\ No newline at end of file
+            assert len(history) >= 2
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_ticker(self, price_generator, price_repository):
+        """Test runtime changes to the ticker universe."""
+        await price_generator.initialize_tickers()
+        version = price_generator.universe_version
+
+        ticker = await price_generator.add_ticker("NEW_01", "New Item", 42.0)
+        assert ticker.current_price == 42.0
+        assert price_generator.get_ticker("NEW_01") is ticker
+        assert price_generator.universe_version == version + 1
+        assert price_generator.get_sorted_ticker_ids() == ["ITEM_00", "ITEM_01", "ITEM_02", "NEW_01"]
+        with pytest.raises(ValueError, match="already exists"):
+            await price_generator.add_ticker("NEW_01", "Duplicate")
+
+        await price_generator._update_all_prices()
+        assert len(await price_repository.get_history("NEW_01")) == 2
+
+        await price_generator.remove_ticker("NEW_01")
+        assert price_generator.get_ticker("NEW_01") is None
+        assert await price_repository.get_history("NEW_01") == []
+        assert price_generator.universe_version == version + 2
+        assert price_generator.get_sorted_ticker_ids() == ["ITEM_00", "ITEM_01", "ITEM_02"]
+        with pytest.raises(ValueError, match="not found"):
+            await price_generator.remove_ticker("NEW_01")
+
+        await price_generator._update_all_prices()
+        assert len(price_generator.get_tickers()) == 3
+
+    @pytest.mark.asyncio
+    async def test_factor_shock_model(self, price_repository, mock_settings):
+        """Test that the factor model drives price steps for every ticker."""
+        mock_settings.price_shock_model = "factor"
+        mock_settings.factor_count = 2
+        with patch('backend.src.services.price_generator.get_settings', return_value=mock_settings):
+            price_generator = PriceGenerator(price_repository)
+
+        await price_generator.initialize_tickers()
+        await price_generator.add_ticker("NEW_01", "New Item")
+        assert len(price_generator.factor_model) == 4
+
+        await price_generator._update_all_prices()
+        await price_generator.remove_ticker("ITEM_00")
+        await price_generator._update_all_prices()
+
+        assert len(price_generator.factor_model) == 3
+        for ticker in price_generator.get_tickers():
+            assert len(await price_repository.get_history(ticker.id)) >= 2
+
+    @pytest.mark.asyncio
+    async def test_remove_during_round_is_not_resurrected(self, price_repository, mock_settings):
+        """Test that a ticker removed while a round is stored gets no indicators or events."""
+        with patch('backend.src.services.price_generator.get_settings', return_value=mock_settings), \
+                patch('backend.src.services.indicator_engine.get_settings', return_value=mock_settings):
+            price_generator = PriceGenerator(price_repository, IndicatorEngine())
+        await price_generator.initialize_tickers()
+
+        emitted = []
+
+        async def record(event):
+            emitted.append(event.ticker_id)
+
+        event_bus.subscribe("price_update", record)
+        try:
+            await price_repository._rw_lock.acquire_write()
+            round_task = asyncio.create_task(price_generator._update_all_prices())
+            await asyncio.sleep(0)
+            remove_task = asyncio.create_task(price_generator.remove_ticker("ITEM_01"))
+            await asyncio.sleep(0)
+            price_repository._rw_lock.release_write()
+            await asyncio.gather(round_task, remove_task)
+        finally:
+            event_bus.unsubscribe("price_update", record)
+
+        assert emitted == ["ITEM_00", "ITEM_02"]
+        assert price_generator.indicator_engine.get_indicators("ITEM_01") is None
+        assert await price_repository.get_history("ITEM_01") == []
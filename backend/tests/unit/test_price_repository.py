@@ -0,0 +1,153 @@
+import pytest
+from array import array
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
+from backend.src.repositories.timestamp_index import TimestampIndex
+from backend.src.domain.entities.price import Price
+from backend.src.core.config import Settings
+from backend.src.core.timeutils import to_epoch_seconds
+
+
+T0 = datetime(2024, 1, 15, 10, 30)
+
+
+@pytest.fixture
+def price_repository():
+    with patch('backend.src.repositories.price_repository.get_settings',
+               return_value=Settings(max_history_size=5)):
+        return AsyncRWLockPriceRepository()
+
+
+async def add_series(repository, ticker_id: str, values, start: datetime = T0) -> None:
+    await repository.add_prices(
+        Price(ticker_id=ticker_id, value=value, timestamp=start + timedelta(seconds=i))
+        for i, value in enumerate(values)
+    )
+
+
+class TestTimestampIndex:
+    def test_as_of_and_window(self):
+        index = TimestampIndex(capacity=10)
+        for i in range(5):
+            index.append(float(i * 10), 100.0 + i)
+
+        assert index.as_of(-1.0) is None
+        assert index.as_of(0.0) == (0.0, 100.0)
+        assert index.as_of(25.0) == (20.0, 102.0)
+        assert index.as_of(1000.0) == (40.0, 104.0)
+
+        timestamps, values = index.window(10.0, 30.0)
+        assert list(timestamps) == [10.0, 20.0, 30.0]
+        assert list(values) == [101.0, 102.0, 103.0]
+
+    def test_capacity_drops_oldest(self):
+        index = TimestampIndex(capacity=3)
+        for i in range(10):
+            index.append(float(i), float(i + 1))
+
+        assert len(index) == 3
+        assert index.as_of(6.5) is None
+        assert index.as_of(7.0) == (7.0, 8.0)
+
+    def test_out_of_order_append_stays_sorted(self):
+        index = TimestampIndex(capacity=10)
+        index.append(10.0, 1.0)
+        index.append(30.0, 3.0)
+        index.append(20.0, 2.0)
+
+        assert index.as_of(25.0) == (20.0, 2.0)
+        assert list(index.window(0.0, 100.0)[0]) == [10.0, 20.0, 30.0]
+
+    def test_extend_keeps_capacity(self):
+        index = TimestampIndex(capacity=3)
+        index.append(0.0, 1.0)
+        index.extend(array("d", [1.0, 2.0, 3.0]), array("d", [2.0, 3.0, 4.0]))
+
+        assert len(index) == 3
+        assert index.as_of(0.5) is None
+        assert list(index.points()[1]) == [2.0, 3.0, 4.0]
+        assert list(index.points(limit=2)[0]) == [2.0, 3.0]
+
+
+class TestPriceRepositoryAsOf:
+    @pytest.mark.asyncio
+    async def test_prices_as_of_all_tickers(self, price_repository):
+        await add_series(price_repository, "ITEM_00", [10.0, 11.0, 12.0])
+        await add_series(price_repository, "ITEM_01", [20.0], start=T0 + timedelta(seconds=2))
+
+        prices = await price_repository.get_prices_as_of(T0 + timedelta(seconds=1, milliseconds=500))
+
+        assert prices["ITEM_00"].value == 11.0
+        assert prices["ITEM_00"].timestamp == T0 + timedelta(seconds=1)
+        assert prices["ITEM_01"] is None
+
+    @pytest.mark.asyncio
+    async def test_prices_as_of_selected_tickers(self, price_repository):
+        await add_series(price_repository, "ITEM_00", [10.0, 11.0])
+
+        prices = await price_repository.get_prices_as_of(
+            (T0 + timedelta(seconds=5)).replace(tzinfo=timezone.utc),
+            ["ITEM_00", "MISSING"]
+        )
+
+        assert prices["ITEM_00"].value == 11.0
+        assert prices["MISSING"] is None
+
+    @pytest.mark.asyncio
+    async def test_window_stats(self, price_repository):
+        await add_series(price_repository, "ITEM_00", [10.0, 14.0, 9.0, 12.0, 13.0])
+
+        stats = await price_repository.get_window_stats(
+            "ITEM_00", T0 + timedelta(seconds=1), T0 + timedelta(seconds=3)
+        )
+
+        assert stats["count"] == 3
+        assert (stats["open"], stats["close"]) == (14.0, 12.0)
+        assert (stats["high"], stats["low"]) == (14.0, 9.0)
+        assert stats["mean"] == pytest.approx(35.0 / 3)
+        assert stats["change"] == -2.0
+        before = await price_repository.get_window_stats(
+            "ITEM_00", T0 - timedelta(hours=1), T0 - timedelta(minutes=1)
+        )
+        assert before is None
+
+    @pytest.mark.asyncio
+    async def test_index_follows_history_limits(self, price_repository):
+        await add_series(price_repository, "ITEM_00", [float(v) for v in range(1, 9)])
+        await price_repository.clear_history("ITEM_01")
+
+        history = await price_repository.get_history("ITEM_00")
+        stats = await price_repository.get_window_stats("ITEM_00", T0, T0 + timedelta(hours=1))
+
+        assert stats["count"] == len(history) == 5
+        assert stats["open"] == history[0].value
+
+        await price_repository.clear_history("ITEM_00")
+        assert "ITEM_00" not in await price_repository.get_prices_as_of(T0 + timedelta(hours=1))
+        assert (await price_repository.get_prices_as_of(T0, ["ITEM_00"]))["ITEM_00"] is None
+        assert await price_repository.export_history() == {}
+
+
+class TestPriceRepositoryImport:
+    @pytest.mark.asyncio
+    async def test_imported_history_precedes_live_prices(self, price_repository):
+        start = to_epoch_seconds(T0)
+        await price_repository.import_history({
+            "ITEM_00": (array("d", [start + i for i in range(4)]), array("d", [1.0, 2.0, 3.0, 4.0]))
+        })
+
+        latest = await price_repository.get_latest_price("ITEM_00")
+        assert latest == Price(ticker_id="ITEM_00", value=4.0, timestamp=T0 + timedelta(seconds=3))
+
+        await add_series(price_repository, "ITEM_00", [5.0, 6.0], start=T0 + timedelta(seconds=4))
+
+        history = await price_repository.get_history("ITEM_00")
+        assert [p.value for p in history] == [2.0, 3.0, 4.0, 5.0, 6.0]
+        assert history[0].timestamp == T0 + timedelta(seconds=1)
+        assert [p.value for p in await price_repository.get_history("ITEM_00", limit=3)] == [4.0, 5.0, 6.0]
+        assert [p.value for p in await price_repository.get_history("ITEM_00", limit=1)] == [6.0]
+
+        timestamps, values = (await price_repository.export_history())["ITEM_00"]
+        assert list(values) == [2.0, 3.0, 4.0, 5.0, 6.0]
+        assert timestamps[0] == start + 1
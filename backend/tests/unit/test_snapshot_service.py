@@ -0,0 +1,112 @@
+import os
+import pytest
+from unittest.mock import patch
+from backend.src.services.price_generator import PriceGenerator
+from backend.src.services.snapshot_service import SnapshotService, encode_snapshot, decode_snapshot
+from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
+from backend.src.repositories.compressed_history import CompressedPriceRepository
+from backend.src.core.config import Settings
+
+
+@pytest.fixture
+def mock_settings(tmp_path):
+    return Settings(
+        ticker_count=3,
+        initial_price_min=50.0,
+        initial_price_max=100.0,
+        snapshot_path=str(tmp_path / "state" / "snapshot.bin")
+    )
+
+
+def make_services(mock_settings, repository_class=AsyncRWLockPriceRepository):
+    with patch('backend.src.repositories.price_repository.get_settings', return_value=mock_settings), \
+            patch('backend.src.repositories.compressed_history.get_settings', return_value=mock_settings), \
+            patch('backend.src.services.price_generator.get_settings', return_value=mock_settings), \
+            patch('backend.src.services.snapshot_service.get_settings', return_value=mock_settings):
+        repository = repository_class()
+        generator = PriceGenerator(repository)
+        return generator, repository, SnapshotService(generator, repository)
+
+
+class TestSnapshotService:
+    @pytest.mark.asyncio
+    async def test_save_and_restore(self, mock_settings):
+        """Test that a restored instance continues from the saved state."""
+        generator, repository, snapshot_service = make_services(mock_settings)
+        await generator.initialize_tickers()
+        await generator._update_all_prices()
+
+        assert await snapshot_service.save() is True
+        assert os.path.exists(mock_settings.snapshot_path)
+        assert not os.path.exists(f"{mock_settings.snapshot_path}.tmp")
+
+        restored_generator, restored_repository, restored_service = make_services(mock_settings)
+        assert await restored_service.restore() is True
+
+        for ticker in generator.get_tickers():
+            restored = restored_generator.get_ticker(ticker.id)
+            assert restored is not None
+            assert restored.name == ticker.name
+            assert restored.current_price == ticker.current_price
+            assert restored.initial_price == ticker.initial_price
+            assert restored.updated_at == ticker.updated_at
+
+            history = await repository.get_history(ticker.id)
+            restored_history = await restored_repository.get_history(ticker.id)
+            assert [p.value for p in restored_history] == [p.value for p in history]
+            assert [p.timestamp for p in restored_history] == [p.timestamp for p in history]
+
+    @pytest.mark.asyncio
+    async def test_restore_into_compressed_repository(self, mock_settings):
+        """Test that history saved from one backend restores into the other."""
+        generator, repository, snapshot_service = make_services(mock_settings)
+        await generator.initialize_tickers()
+        for _ in range(3):
+            await generator._update_all_prices()
+        assert await snapshot_service.save() is True
+
+        _, restored_repository, restored_service = make_services(mock_settings, CompressedPriceRepository)
+        assert await restored_service.restore() is True
+
+        for ticker in generator.get_tickers():
+            history = await repository.get_history(ticker.id)
+            restored_history = await restored_repository.get_history(ticker.id)
+            assert [p.value for p in restored_history] == [p.value for p in history]
+            assert [p.timestamp for p in restored_history] == [p.timestamp for p in history]
+
+    @pytest.mark.asyncio
+    async def test_restore_without_snapshot(self, mock_settings):
+        """Test that restore reports a cold start when no snapshot exists."""
+        generator, _, snapshot_service = make_services(mock_settings)
+
+        assert await snapshot_service.restore() is False
+        assert generator.get_tickers() == []
+
+    @pytest.mark.asyncio
+    async def test_restore_corrupt_snapshot(self, mock_settings):
+        """Test that a corrupt snapshot is ignored."""
+        generator, _, snapshot_service = make_services(mock_settings)
+        os.makedirs(os.path.dirname(mock_settings.snapshot_path))
+        with open(mock_settings.snapshot_path, "wb") as f:
+            f.write(b"not a snapshot at all, just some bytes")
+
+        assert await snapshot_service.restore() is False
+        assert generator.get_tickers() == []
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_path(self, mock_settings):
+        """Test that snapshots are disabled when no path is configured."""
+        mock_settings.snapshot_path = ""
+        _, _, snapshot_service = make_services(mock_settings)
+
+        assert snapshot_service.enabled is False
+        assert await snapshot_service.save() is False
+        assert await snapshot_service.restore() is False
+
+    def test_decode_rejects_truncated_payload(self, mock_settings):
+        """Test that a payload whose size does not match its header is rejected."""
+        payload = encode_snapshot([], {}, 0.0)
+
+        assert decode_snapshot(memoryview(payload)) == ([], {})
+        with pytest.raises(ValueError):
+            decode_snapshot(memoryview(payload + b"\x00"))
@@ -0,0 +1,62 @@
+from backend.src.services.subscriber_registry import SubscriberRegistry
+
+
+class TestSubscriberRegistry:
+    def test_add_and_get(self):
+        registry = SubscriberRegistry()
+        registry.add("ITEM_00", "a")
+        registry.add("ITEM_00", "b")
+        registry.add("ITEM_01", "c")
+
+        assert registry.get("ITEM_00") == {"a", "b"}
+        assert registry.count("ITEM_01") == 1
+        assert registry.total() == 3
+        assert registry.get("MISSING") == frozenset()
+
+    def test_snapshots_are_immutable(self):
+        """Readers keep a stable view while writers replace the set."""
+        registry = SubscriberRegistry()
+        registry.add("ITEM_00", "a")
+        snapshot = registry.get("ITEM_00")
+
+        registry.add("ITEM_00", "b")
+        registry.discard("ITEM_00", "a")
+
+        assert snapshot == {"a"}
+        assert registry.get("ITEM_00") == {"b"}
+
+    def test_discard_many_drops_empty_tickers(self):
+        registry = SubscriberRegistry()
+        registry.add("ITEM_00", "a")
+        registry.add("ITEM_00", "b")
+
+        registry.discard_many("ITEM_00", ["a", "b", "missing"])
+        registry.discard("MISSING", "a")
+
+        assert registry.count("ITEM_00") == 0
+        assert registry.total() == 0
+
+    def test_pop_returns_last_snapshot(self):
+        registry = SubscriberRegistry()
+        registry.add("ITEM_00", "a")
+        registry.add("ITEM_00", "b")
+
+        assert registry.pop("ITEM_00") == frozenset({"a", "b"})
+        assert registry.pop("ITEM_00") == frozenset()
+        assert registry.count("ITEM_00") == 0
+
+    def test_changes_are_batched_until_read(self):
+        """Queued subscribes and unsubscribes are published as one snapshot."""
+        registry = SubscriberRegistry()
+        registry.add("ITEM_00", "a")
+        snapshot = registry.get("ITEM_00")
+
+        registry.add("ITEM_00", "b")
+        registry.discard("ITEM_00", "b")
+        registry.discard("ITEM_00", "a")
+        registry.add("ITEM_00", "a")
+        registry.add("ITEM_00", "c")
+
+        assert registry.get("ITEM_00") == {"a", "c"}
+        assert registry.get("ITEM_00") is registry.get("ITEM_00")
+        assert snapshot == {"a"}
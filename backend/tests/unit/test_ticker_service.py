@@ -1,12 +1,15 @@
+import json
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from backend.src.services.ticker_service import TickerService
 from backend.src.services.price_generator import PriceGenerator
+from backend.src.services.indicator_engine import IndicatorEngine
 from backend.src.repositories.price_repository import AsyncRWLockPriceRepository
 from backend.src.domain.entities.ticker import Ticker
 from backend.src.domain.entities.price import Price
+from backend.src.core.config import Settings
 
 
 @pytest.fixture
@@ -96,3 +99,75 @@ class TestTickerService:
 
         assert result["value"] == 123.46
         assert "timestamp" in result
+
+    def test_get_ticker_indicators(self, mock_price_generator: PriceGenerator):
+        """Ensure indicators from the engine are returned for a ticker."""
+        engine = MagicMock(spec=IndicatorEngine)
+        engine.get_indicators.return_value = {"ema": 101.0}
+        service = TickerService(mock_price_generator, AsyncMock(), engine)
+
+        result = service.get_ticker_indicators("TEST_01")
+
+        assert result == {"ticker_id": "TEST_01", "indicators": {"ema": 101.0}}
+
+    def test_get_ticker_indicators_disabled(self, ticker_service: TickerService):
+        """Ensure a missing indicator engine is reported as unavailable."""
+        with pytest.raises(ValueError, match="No indicators available"):
+            ticker_service.get_ticker_indicators("TEST_01")
+
+
+class TestTickerListing:
+
+    @pytest.fixture
+    def listing_service(self) -> TickerService:
+        settings = Settings(ticker_count=12, initial_price_min=50.0, initial_price_max=100.0)
+        repository = AsyncRWLockPriceRepository()
+        with patch('backend.src.services.price_generator.get_settings', return_value=settings):
+            generator = PriceGenerator(repository)
+        return TickerService(generator, repository)
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self, listing_service: TickerService):
+        """Ensure following cursors walks every ticker once, in id order."""
+        await listing_service.price_generator.initialize_tickers()
+        ids, cursor = [], None
+        while True:
+            page = listing_service.get_tickers_page(cursor=cursor, limit=5)
+            ids.extend(ticker["id"] for ticker in json.loads(page.body))
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert ids == [f"ITEM_{i:02d}" for i in range(12)]
+
+    @pytest.mark.asyncio
+    async def test_prefix_filter(self, listing_service: TickerService):
+        """Ensure only ids starting with the prefix are listed."""
+        await listing_service.price_generator.initialize_tickers()
+        page = listing_service.get_tickers_page(prefix="ITEM_1", limit=2)
+
+        assert [t["id"] for t in json.loads(page.body)] == ["ITEM_10", "ITEM_11"]
+        assert page.next_cursor is None
+        assert json.loads(listing_service.get_tickers_page(prefix="NOPE").body) == []
+
+    @pytest.mark.asyncio
+    async def test_pages_cached_until_listing_changes(self, listing_service: TickerService):
+        """Ensure serialized pages are reused until a tick or universe change."""
+        await listing_service.price_generator.initialize_tickers()
+        page = listing_service.get_tickers_page()
+        assert listing_service.get_tickers_page() is page
+        assert len(json.loads(page.body)) == 12
+
+        await listing_service.price_generator._update_all_prices()
+        ticked = listing_service.get_tickers_page()
+        assert ticked is not page
+        assert ticked.etag != page.etag
+
+        await listing_service.add_ticker("ITEM_05A", initial_price=10.0)
+        added = listing_service.get_tickers_page(cursor="ITEM_05", limit=1)
+        assert json.loads(added.body)[0]["id"] == "ITEM_05A"
+        assert added.etag != ticked.etag
+
+        removed = await listing_service.remove_ticker("ITEM_05A")
+        assert removed["id"] == "ITEM_05A"
+        assert "ITEM_05A" not in listing_service.get_tickers_page().body.decode()
@@ -0,0 +1,148 @@
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import WebSocket
+from backend.src.services.websocket_manager import WebSocketManager
+from backend.src.services.timing_wheel import HashedTimingWheel
+from backend.src.services.indicator_engine import IndicatorEngine
+from backend.src.domain.events.price_events import PriceUpdateEvent
+from backend.src.core.config import Settings
+
+
+@pytest.fixture
+def mock_settings():
+    return Settings(
+        ws_heartbeat_interval=2.0,
+        ws_idle_timeout=5.0,
+        ws_timer_tick=1.0,
+        ws_timer_wheel_slots=4
+    )
+
+
+@pytest.fixture
+def websocket_manager(mock_settings):
+    with patch('backend.src.services.websocket_manager.get_settings', return_value=mock_settings):
+        return WebSocketManager()
+
+
+@pytest.fixture
+def clock():
+    with patch('backend.src.services.websocket_manager.time.monotonic') as monotonic:
+        monotonic.return_value = 0.0
+        yield monotonic
+
+
+def make_websocket() -> WebSocket:
+    return AsyncMock(spec=WebSocket)
+
+
+async def advance(manager: WebSocketManager, clock, ticks: int) -> None:
+    for _ in range(ticks):
+        clock.return_value += manager._heartbeats.tick_duration
+        await manager._process_heartbeats(manager._heartbeats.advance())
+
+
+class TestHashedTimingWheel:
+    def test_expires_after_delay(self):
+        wheel = HashedTimingWheel(slot_count=4, tick_duration=1.0)
+        wheel.schedule("a", 2.0)
+
+        assert wheel.advance() == []
+        assert wheel.advance() == ["a"]
+        assert "a" not in wheel
+
+    def test_delay_longer_than_revolution(self):
+        wheel = HashedTimingWheel(slot_count=4, tick_duration=1.0)
+        wheel.schedule("a", 6.0)
+
+        expired = [wheel.advance() for _ in range(6)]
+
+        assert expired == [[], [], [], [], [], ["a"]]
+
+    def test_reschedule_and_cancel(self):
+        wheel = HashedTimingWheel(slot_count=4, tick_duration=1.0)
+        wheel.schedule("a", 1.0)
+        wheel.schedule("a", 3.0)
+        wheel.schedule("b", 1.0)
+        wheel.cancel("b")
+
+        assert wheel.advance() == []
+        assert wheel.advance() == []
+        assert wheel.advance() == ["a"]
+        assert len(wheel) == 0
+
+
+class TestWebSocketManagerHeartbeats:
+    @pytest.mark.asyncio
+    async def test_idle_connection_is_pinged_then_reaped(self, websocket_manager, clock):
+        """Test that a silent client is pinged and eventually evicted."""
+        ws = make_websocket()
+        await websocket_manager.connect(ws, "ITEM_00")
+
+        await advance(websocket_manager, clock, 2)
+        ws.send_text.assert_awaited_once_with('{"type": "ping"}')
+
+        await advance(websocket_manager, clock, 3)
+        ws.close.assert_awaited_once()
+        assert websocket_manager.get_connection_count() == 0
+        assert websocket_manager.get_stats()["reaped_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_active_connection_is_kept(self, websocket_manager, clock):
+        """Test that a client that keeps answering is never reaped."""
+        ws = make_websocket()
+        await websocket_manager.connect(ws, "ITEM_00")
+
+        for _ in range(10):
+            await advance(websocket_manager, clock, 1)
+            websocket_manager.touch(ws)
+
+        ws.send_text.assert_not_awaited()
+        ws.close.assert_not_awaited()
+        assert websocket_manager.get_connection_count("ITEM_00") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_ping_reaps_immediately(self, websocket_manager, clock):
+        """Test that a connection whose ping fails is evicted at once."""
+        ws = make_websocket()
+        ws.send_text.side_effect = RuntimeError("connection lost")
+        await websocket_manager.connect(ws, "ITEM_00")
+
+        await advance(websocket_manager, clock, 2)
+
+        assert websocket_manager.get_connection_count() == 0
+        assert websocket_manager.get_stats()["reaped_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_heartbeat(self, websocket_manager, clock):
+        """Test that disconnected clients leave no heartbeat behind."""
+        ws = make_websocket()
+        await websocket_manager.connect(ws, "ITEM_00")
+        await websocket_manager.disconnect(ws, "ITEM_00")
+
+        assert len(websocket_manager._heartbeats) == 0
+        await advance(websocket_manager, clock, 6)
+        ws.send_text.assert_not_awaited()
+
+
+class TestWebSocketManagerBroadcast:
+    @pytest.mark.asyncio
+    async def test_indicators_only_for_opted_in_clients(self, websocket_manager):
+        """Test that indicators are looked up only when a subscriber opted in."""
+        engine = MagicMock(spec=IndicatorEngine)
+        engine.get_indicators.return_value = {"ema": 101.0}
+        websocket_manager.indicator_engine = engine
+        plain, opted_in = make_websocket(), make_websocket()
+        event = PriceUpdateEvent(ticker_id="ITEM_00", price=100.0, timestamp=datetime.utcnow())
+
+        await websocket_manager.connect(plain, "ITEM_00")
+        await websocket_manager.broadcast_price_update(event)
+        engine.get_indicators.assert_not_called()
+
+        await websocket_manager.connect(opted_in, "ITEM_00", with_indicators=True)
+        await websocket_manager.broadcast_price_update(event)
+        engine.get_indicators.assert_called_once_with("ITEM_00")
+
+        assert "indicators" not in json.loads(plain.send_text.await_args.args[0])["data"]
+        assert json.loads(opted_in.send_text.await_args.args[0])["data"]["indicators"] == {"ema": 101.0}
@@ -32,6 +32,10 @@ export class WebSocketService {
       this.ws.onmessage = (event) => {
         try {
           const message: WebSocketMessage = JSON.parse(event.data);
+          if (message.type === 'ping') {
+            this.ws?.send(JSON.stringify({ type: 'pong' }));
+            return;
+          }
           this.handleMessage(message);
         } catch (error) {
           console.error('Failed to parse WebSocket message:', error);
@@ -17,12 +17,23 @@ export interface PriceHistory {
   history: PricePoint[];
 }
 
+export interface Indicators {
+  ema: number;
+  volatility: number | null;
+  min: number;
+  max: number;
+  vwap: number | null;
+  window: number;
+  samples: number;
+}
+
 export interface WebSocketMessage {
-  type: 'price_update' | 'error';
+  type: 'price_update' | 'error' | 'ping';
   data?: {
     ticker_id: string;
     price: number;
     timestamp: string;
+    indicators?: Indicators;
   };
   message?: string;
 }